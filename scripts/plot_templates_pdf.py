@@ -70,7 +70,13 @@ def process_hdf5_file(h5_path: Path, output_dir: Path, max_templates: int | None
 
     with h5py.File(h5_path, "r") as f, PdfPages(pdf_path) as pdf:
         # Standard wavelength array (log grid, *not* linear Å), shape (NW,)
-        wave = f["metadata/standard_wavelength"][:]
+        meta = f["metadata"]
+        if "standard_wavelength" in meta:
+            wave = meta["standard_wavelength"][:]
+        else:
+            # User files store only the grid parameters
+            nw = int(meta.attrs["NW"])
+            wave = float(meta.attrs["W0"]) * np.exp((np.arange(nw) + 0.5) * float(meta.attrs["DWLOG"]))
 
         templates_group = f["templates"]
         template_names = list(templates_group.keys())
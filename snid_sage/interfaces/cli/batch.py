@@ -26,10 +26,7 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 from snid_sage.snid.snid import preprocess_spectrum, run_snid_analysis, SNIDResult
 from snid_sage.shared.exceptions.core_exceptions import SpectrumProcessingError
 from snid_sage.shared.utils.math_utils import (
-    estimate_weighted_redshift,
-    estimate_weighted_epoch,
-    weighted_redshift_se,
-    weighted_epoch_se,
+    WeightedInputs,
     get_best_metric_value
 )
 from snid_sage.shared.utils.results_formatter import clean_template_name
@@ -632,6 +629,7 @@ def _create_cluster_aware_summary(result: SNIDResult, spectrum_name: str, spectr
             
             # Collect age data for separate age estimation
             ages_for_estimation = []
+            age_redshift_errors = []
             age_metric_values = []
             
             for m in cluster_matches:
@@ -651,12 +649,14 @@ def _create_cluster_aware_summary(result: SNIDResult, spectrum_name: str, spectr
                 age = template.get('age', 0.0) if template else 0.0
                 if age is not None and np.isfinite(age):
                     ages_for_estimation.append(age)
+                    # Same row's sigma_z, so ages and weights stay aligned; invalid
+                    # sigmas are dropped by WeightedInputs.from_raw
+                    age_redshift_errors.append(z_err if z_err is not None else np.nan)
                     age_metric_values.append(metric_val)
             
             # Weighted redshift mean and SE using canonical weights
             if redshifts_with_errors:
-                z_final = estimate_weighted_redshift(redshifts_with_errors, redshift_errors, metric_values)
-                z_se = weighted_redshift_se(redshifts_with_errors, redshift_errors, metric_values)
+                z_final, z_se = WeightedInputs.from_raw(redshifts_with_errors, redshift_errors, metric_values).mean_and_se()
                 summary['cluster_redshift_weighted'] = z_final
                 summary['cluster_redshift_se_weighted'] = z_se
             else:
@@ -664,9 +664,8 @@ def _create_cluster_aware_summary(result: SNIDResult, spectrum_name: str, spectr
                 summary['cluster_redshift_se_weighted'] = np.nan
 
             # Weighted epoch mean and SE using the same canonical weights
-            if ages_for_estimation and redshift_errors:
-                age_final = estimate_weighted_epoch(ages_for_estimation, redshift_errors, age_metric_values)
-                age_se = weighted_epoch_se(ages_for_estimation, redshift_errors, age_metric_values)
+            if ages_for_estimation:
+                age_final, age_se = WeightedInputs.from_raw(ages_for_estimation, age_redshift_errors, age_metric_values).mean_and_se()
                 summary['cluster_age_weighted'] = age_final
                 summary['cluster_age_se_weighted'] = age_se
                 summary['redshift_age_covariance'] = 0.0
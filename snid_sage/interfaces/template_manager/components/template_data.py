@@ -51,6 +51,12 @@ class TemplateData:
                 if 'metadata' in f and 'standard_wavelength' in f['metadata']:
                     self.wave_data = f['metadata']['standard_wavelength'][:]
                     _LOGGER.info(f"Loaded wavelength data: {len(self.wave_data)} points")
+                elif 'metadata' in f and all(k in f['metadata'].attrs for k in ('NW', 'W0', 'DWLOG')):
+                    # User files store only the grid parameters; regenerate the grid
+                    meta_attrs = f['metadata'].attrs
+                    nw = int(meta_attrs['NW'])
+                    self.wave_data = float(meta_attrs['W0']) * np.exp((np.arange(nw) + 0.5) * float(meta_attrs['DWLOG']))
+                    _LOGGER.info(f"Regenerated wavelength grid from metadata: {nw} points")
                 else:
                     _LOGGER.warning("No wavelength data found in metadata")
                 
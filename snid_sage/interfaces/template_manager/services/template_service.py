@@ -20,21 +20,43 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 import json
+import math
 import threading
-from importlib import resources
 import os
+import sys
 
 import numpy as np
-import h5py
+
+# Optional C-based JSON encoder for faster index writes; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# h5py (and the HDF5 shared library) is loaded on first use so that merely
+# importing this module stays cheap for callers that never open a template file.
+_h5py = None
+
+
+def _get_h5py():
+    """Return the h5py module, importing it on first call."""
+    global _h5py
+    if _h5py is None:
+        import h5py
+        _h5py = h5py
+    return _h5py
 
 
 def _compute_builtin_dir() -> Path:
     """Resolve the packaged templates directory robustly (installed or dev)."""
     # Prefer importlib.resources traversal of the installed package
     try:
+        from importlib import resources
         with resources.as_file(resources.files('snid_sage') / 'templates') as tpl_dir:
             if tpl_dir.exists():
                 return tpl_dir
@@ -78,11 +100,28 @@ class TemplateService:
     """
     HDF5-only template service.
 
-    Thread-safe for write operations via an internal lock.
+    Thread-safe for write operations. HDF5 writes are serialized per target
+    file (so imports into different per-type files can run in parallel), and
+    the user index JSON is guarded by a separate re-entrant lock.
+
+    Index readers (``get_user_index``, ``get_merged_index``,
+    ``get_types_and_subtypes``, ``user_template_names``) may run on the GUI
+    thread while a write runs on a worker: the index file is replaced
+    atomically, and a reader never caches data that a concurrent write has
+    since invalidated.
     """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
+        self._map_lock = threading.Lock()
+        self._file_locks: Dict[Path, threading.Lock] = {}
+        self._index_lock = threading.RLock()
+        # Derived index data by name ('user', 'merged', 'types', 'names'), each stored as
+        # (cache key, value). The key is the user index path plus its (mtime_ns, size),
+        # so writes by other processes are picked up; in-process writes also bump
+        # _cache_gen so a reader that loaded the old file cannot store it afterwards.
+        self._caches: Dict[str, Tuple[Any, Any]] = {}
+        self._cache_gen = 0
+        self._cache_lock = threading.Lock()
         # Do not auto-create user template directories; user must select a valid folder
         # Lazy cache
         self._standard_grid = StandardGrid()
@@ -90,18 +129,21 @@ class TemplateService:
 
     # ---- Public API ----
     def get_merged_index(self) -> Dict[str, Any]:
-        """Return the merged built-in + user index for the GUI browser."""
+        """Return the merged built-in + user index for the GUI browser.
+
+        The result is cached until templates change; callers must not mutate it.
+        """
+        gen = self._cache_gen
+        key = self._cache_key()
+        cached = self._caches.get("merged")
+        if cached is not None and cached[0] == key:
+            return cached[1]
         builtin = self._read_json(_BUILTIN_INDEX) or {
             "templates": {},
             "by_type": {},
             "template_count": 0,
         }
-        idx_path = _user_index_path()
-        user = self._read_json(idx_path) or {
-            "templates": {},
-            "by_type": {},
-            "template_count": 0,
-        }
+        user = self.get_user_index()
 
         merged_templates: Dict[str, Any] = {}
         merged_templates.update(builtin.get("templates", {}))
@@ -118,12 +160,14 @@ class TemplateService:
             if not bucket.get("storage_file") and meta.get("storage_file"):
                 bucket["storage_file"] = meta["storage_file"]
 
-        return {
+        merged = {
             "version": user.get("version") or builtin.get("version") or "2.0",
             "template_count": len(merged_templates),
             "templates": merged_templates,
             "by_type": by_type,
         }
+        self._cache_store("merged", key, gen, merged)
+        return merged
 
     def get_user_templates_dir(self) -> Optional[str]:
         """Return absolute path to the active user templates directory or None if unset."""
@@ -148,9 +192,16 @@ class TemplateService:
         return data
 
     def get_user_index(self) -> Dict[str, Any]:
-        """Return only the user index (no built-in templates)."""
-        idx_path = _user_index_path()
-        data = self._read_json(idx_path) or {
+        """Return only the user index (no built-in templates).
+
+        The result is cached until templates change; callers must not mutate it.
+        """
+        gen = self._cache_gen
+        key = self._cache_key()
+        cached = self._caches.get("user")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        data = self._read_json(key[0]) or {
             "version": "2.0",
             "template_count": 0,
             "templates": {},
@@ -162,14 +213,56 @@ class TemplateService:
             data["templates"] = {}
         if not data.get("template_count"):
             data["template_count"] = len(data.get("templates", {}))
+        self._cache_store("user", key, gen, data)
         return data
 
+    def get_types_and_subtypes(self) -> Tuple[List[str], Dict[str, Tuple[str, ...]]]:
+        """Return (sorted types, known subtypes per type) for GUI pickers.
+
+        Types cover built-in and user templates; subtypes come from the built-in
+        library. The result is cached until templates are added, edited or
+        removed, the user templates folder changes, or the user index file
+        changes on disk.
+        """
+        gen = self._cache_gen
+        key = self._cache_key()
+        cached = self._caches.get("types")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        builtin_templates = self.get_builtin_index().get("templates", {})
+        user_templates = self.get_user_index().get("templates") or {}
+
+        types = set()
+        buckets: Dict[str, set] = {}
+        for meta in builtin_templates.values():
+            ttype = (meta or {}).get("type", "Unknown")
+            types.add(ttype)
+            st = (meta or {}).get("subtype", "Unknown")
+            bucket = buckets.setdefault(ttype, set())
+            if isinstance(st, str):
+                bucket.add(st)
+        for meta in user_templates.values():
+            types.add((meta or {}).get("type", "Unknown"))
+
+        result = (sorted(types), {k: tuple(sorted(v)) for k, v in buckets.items()})
+        self._cache_store("types", key, gen, result)
+        return result
+
     def has_user_templates(self) -> bool:
         """Return True if any user templates exist."""
-        idx_path = _user_index_path()
-        data = self._read_json(idx_path) or {}
-        templates = (data.get("templates") or {})
-        return bool(templates)
+        return bool(self.get_user_index().get("templates"))
+
+    def user_template_names(self) -> FrozenSet[str]:
+        """Return the names of all user templates (cached until templates change)."""
+        gen = self._cache_gen
+        key = self._cache_key()
+        cached = self._caches.get("names")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        names = frozenset((self.get_user_index().get("templates") or {}).keys())
+        self._cache_store("names", key, gen, names)
+        return names
 
     def add_template_from_arrays(
         self,
@@ -194,12 +287,13 @@ class TemplateService:
         if wave.size == 0 or flux.size == 0:
             return False
         try:
-            with self._lock:
-                h5_abs_path = self._ensure_user_h5_for_type(ttype, target_dir=target_dir)
+            # Rebin to the standard grid (no lock needed for pure computation)
+            rebinned_flux = self._rebin_to_standard_grid(wave, flux)
+            fft = np.fft.fft(rebinned_flux)
 
-                # Rebin to the standard grid
-                rebinned_flux = self._rebin_to_standard_grid(wave, flux)
-                fft = np.fft.fft(rebinned_flux)
+            h5_abs_path = self._user_h5_path_for_type(ttype, target_dir=target_dir)
+            with self._lock_for(h5_abs_path):
+                self._ensure_user_h5_for_type(ttype, target_dir=target_dir)
 
                 # Write (append/combine or create) to HDF5
                 final_name, combined, epochs_count, status = self._append_to_h5(
@@ -218,6 +312,8 @@ class TemplateService:
                     # Do not create a suffixed template when explicitly adding to existing
                     return False
 
+            storage_file = self._norm_path(h5_abs_path)
+            with self._index_lock:
                 # Update user index (omit non-essential fields like phase/age/rebinned)
                 # Determine index path (override when target_dir provided)
                 idx_path = self._index_path_for_target(target_dir)
@@ -232,7 +328,7 @@ class TemplateService:
                     # Update epochs count; preserve existing metadata, enforce storage_file
                     entry = index_templates[final_name]
                     entry["epochs"] = int(epochs_count)
-                    entry["storage_file"] = str(h5_abs_path).replace("\\", "/")
+                    entry["storage_file"] = storage_file
                     if sim_flag is not None:
                         entry["sim_flag"] = int(sim_flag)
                 else:
@@ -241,7 +337,7 @@ class TemplateService:
                         "subtype": subtype,
                         "redshift": float(redshift),
                         "epochs": 1 if not combined else int(epochs_count),
-                        "storage_file": str(h5_abs_path).replace("\\", "/"),
+                        "storage_file": storage_file,
                     }
                     if sim_flag is not None:
                         index_templates[final_name]["sim_flag"] = int(sim_flag)
@@ -252,14 +348,16 @@ class TemplateService:
 
                 if idx_path is not None:
                     self._write_json_atomic(idx_path, index)
+                self._invalidate_caches()
             return True
         except Exception:
             return False
 
     def update_metadata(self, name: str, changes: Dict[str, Any]) -> bool:
         """Update metadata attributes for a user template and its index entry."""
+        h5py = _get_h5py()
         try:
-            with self._lock:
+            with self._index_lock:
                 idx_path = _user_index_path()
                 index = self._read_json(idx_path) or {}
                 tmpl = (index.get("templates") or {}).get(name)
@@ -271,7 +369,7 @@ class TemplateService:
                 if not storage_abs.exists():
                     return False
                 # Update HDF5 attrs
-                with h5py.File(storage_abs, "a") as f:
+                with self._lock_for(storage_abs), h5py.File(storage_abs, "a") as f:
                     g = f["templates"].get(name)
                     if g is None:
                         return False
@@ -291,14 +389,16 @@ class TemplateService:
                 index["by_type"] = self._compute_by_type(index.get("templates", {}))
                 if idx_path is not None:
                     self._write_json_atomic(idx_path, index)
+                self._invalidate_caches()
             return True
         except Exception:
             return False
 
     def delete(self, name: str) -> bool:
         """Delete a user template group and its index entry."""
+        h5py = _get_h5py()
         try:
-            with self._lock:
+            with self._index_lock:
                 idx_path = _user_index_path()
                 index = self._read_json(idx_path) or {}
                 templates = index.get("templates") or {}
@@ -323,7 +423,8 @@ class TemplateService:
                         return False
                 if not storage_abs.exists():
                     return False
-                with h5py.File(storage_abs, "a") as f:
+                file_lock = self._lock_for(storage_abs)
+                with file_lock, h5py.File(storage_abs, "a") as f:
                     tgroup = f["templates"]
                     if name in tgroup:
                         del tgroup[name]
@@ -344,18 +445,21 @@ class TemplateService:
                     index["template_count"] = len(templates)
                     if idx_path is not None:
                         self._write_json_atomic(idx_path, index)
+                    self._invalidate_caches()
                 # Delete empty H5 file and rebuild index if needed
                 if storage_abs.exists():
-                    try:
-                        with h5py.File(storage_abs, "r") as fchk:
-                            empty_now = ("templates" in fchk and len(fchk["templates"].keys()) == 0)
-                    except Exception:
-                        empty_now = False
-                    if empty_now:
+                    with file_lock:
                         try:
-                            storage_abs.unlink()
+                            with h5py.File(storage_abs, "r") as fchk:
+                                empty_now = ("templates" in fchk and len(fchk["templates"].keys()) == 0)
                         except Exception:
-                            pass
+                            empty_now = False
+                        if empty_now:
+                            try:
+                                storage_abs.unlink()
+                            except Exception:
+                                pass
+                    if empty_now:
                         # Rebuild user index to drop references to deleted file
                         try:
                             self.rebuild_user_index()
@@ -370,9 +474,10 @@ class TemplateService:
 
         Returns a summary: {"removed_groups": int, "deleted_files": int}
         """
+        h5py = _get_h5py()
         summary = {"removed_groups": 0, "deleted_files": 0}
         try:
-            with self._lock:
+            with self._index_lock:
                 idx_path = _user_index_path()
                 index = self._read_json(idx_path) or {"templates": {}}
                 referenced = set((index.get("templates") or {}).keys())
@@ -381,8 +486,9 @@ class TemplateService:
                     return summary
                 for h5_path in (user_dir.glob("templates_*.user.hdf5")):
                     removed_here = 0
+                    file_lock = self._lock_for(h5_path)
                     try:
-                        with h5py.File(h5_path, "a") as f:
+                        with file_lock, h5py.File(h5_path, "a") as f:
                             if "templates" not in f:
                                 continue
                             tgroup = f["templates"]
@@ -403,17 +509,18 @@ class TemplateService:
                     summary["removed_groups"] += removed_here
                     # Optionally delete file if empty
                     if delete_empty_files and h5_path.exists():
-                        try:
-                            with h5py.File(h5_path, "r") as fchk:
-                                is_empty = ("templates" in fchk and len(fchk["templates"].keys()) == 0)
-                        except Exception:
-                            is_empty = False
-                        if is_empty:
+                        with file_lock:
                             try:
-                                h5_path.unlink()
-                                summary["deleted_files"] += 1
+                                with h5py.File(h5_path, "r") as fchk:
+                                    is_empty = ("templates" in fchk and len(fchk["templates"].keys()) == 0)
                             except Exception:
-                                pass
+                                is_empty = False
+                            if is_empty:
+                                try:
+                                    h5_path.unlink()
+                                    summary["deleted_files"] += 1
+                                except Exception:
+                                    pass
                 # Rebuild index to reflect cleanup
                 self.rebuild_user_index()
         except Exception:
@@ -437,37 +544,61 @@ class TemplateService:
             user_dir = get_user_templates_dir(strict=True)
             if not user_dir:
                 return False
-            for h5_path in (user_dir.glob("templates_*.user.hdf5")):
-                with h5py.File(h5_path, "r") as f:
-                    if "templates" not in f:
-                        continue
-                    tg = f["templates"]
-                    for name in tg.keys():
-                        g = tg[name]
-                        attrs = dict(g.attrs)
-                        templates[name] = {
-                            "type": attrs.get("type", "Unknown"),
-                            "subtype": attrs.get("subtype", "Unknown"),
-                            "redshift": float(attrs.get("redshift", 0.0)),
-                            "epochs": int(attrs.get("epochs", 1)),
-                            "storage_file": str(h5_path).replace("\\", "/"),
-                        }
+            # Scanned one file at a time: h5py serializes calls under its global
+            # lock, so a thread pool gives no speedup here
+            for h5_path in sorted(user_dir.glob("templates_*.user.hdf5")):
+                templates.update(self._scan_one_file(h5_path))
             index = {
                 "version": "2.0",
                 "templates": templates,
                 "by_type": self._compute_by_type(templates),
                 "template_count": len(templates),
             }
-            with self._lock:
+            with self._index_lock:
                 idx_path = _user_index_path()
                 if idx_path is None:
                     return False
                 self._write_json_atomic(idx_path, index)
+                self._invalidate_caches()
             return True
         except Exception:
             return False
 
     # ---- Internals ----
+    def _invalidate_caches(self) -> None:
+        """Drop derived data cached from the indices (call after any index write)."""
+        with self._cache_lock:
+            self._cache_gen += 1
+            self._caches = {}
+
+    @staticmethod
+    def _cache_key() -> Tuple[Optional[Path], Optional[Tuple[int, int]]]:
+        """Return (user index path, (mtime_ns, size)) identifying the index on disk."""
+        idx_path = _user_index_path()
+        if idx_path is None:
+            return None, None
+        try:
+            st = os.stat(idx_path)
+        except OSError:
+            return idx_path, None
+        return idx_path, (st.st_mtime_ns, st.st_size)
+
+    def _cache_store(self, name: str, key: Any, gen: int, value: Any) -> None:
+        """Cache a value unless the caches were invalidated since it was read (at ``gen``)."""
+        with self._cache_lock:
+            if gen == self._cache_gen:
+                self._caches[name] = (key, value)
+
+    def _lock_for(self, path: Path) -> threading.Lock:
+        """Return the write lock for a given HDF5 file, creating it on first use."""
+        key = Path(path).resolve()
+        with self._map_lock:
+            lock = self._file_locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self._file_locks[key] = lock
+            return lock
+
     def _rebin_to_standard_grid(self, wave: np.ndarray, flux: np.ndarray) -> np.ndarray:
         """Rebin flux onto the standard logarithmic grid by interpolation in log space."""
         # Guard inputs
@@ -491,8 +622,28 @@ class TemplateService:
             rebinned = rebinned / med
         return rebinned.astype(float, copy=False)
 
-    def _ensure_user_h5_for_type(self, ttype: str, *, target_dir: Optional[Path] = None) -> Path:
-        """Ensure the per-type HDF5 exists in the selected target or user config dir; return absolute path."""
+    def _scan_one_file(self, h5_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Read index entries for every template group in one user HDF5 file."""
+        h5py = _get_h5py()
+        entries: Dict[str, Dict[str, Any]] = {}
+        with h5py.File(h5_path, "r") as f:
+            if "templates" not in f:
+                return entries
+            tg = f["templates"]
+            storage_file = self._norm_path(h5_path)
+            for name in tg.keys():
+                attrs = dict(tg[name].attrs)
+                entries[name] = {
+                    "type": attrs.get("type", "Unknown"),
+                    "subtype": attrs.get("subtype", "Unknown"),
+                    "redshift": float(attrs.get("redshift", 0.0)),
+                    "epochs": int(attrs.get("epochs", 1)),
+                    "storage_file": storage_file,
+                }
+        return entries
+
+    def _user_h5_path_for_type(self, ttype: str, *, target_dir: Optional[Path] = None) -> Path:
+        """Return the per-type HDF5 path in the selected target or user config dir (not created)."""
         safe_type = ttype.replace("/", "_").replace("-", "_").replace(" ", "_")
         base_dir: Optional[Path] = None
         if target_dir is not None:
@@ -501,7 +652,12 @@ class TemplateService:
             base_dir = get_user_templates_dir(strict=True)
         if base_dir is None:
             raise RuntimeError("Templates destination is not set. Configure a User Templates folder or select a destination.")
-        abs_path = Path(base_dir) / f"templates_{safe_type}.user.hdf5"
+        return Path(base_dir) / f"templates_{safe_type}.user.hdf5"
+
+    def _ensure_user_h5_for_type(self, ttype: str, *, target_dir: Optional[Path] = None) -> Path:
+        """Ensure the per-type HDF5 exists in the selected target or user config dir; return absolute path."""
+        h5py = _get_h5py()
+        abs_path = self._user_h5_path_for_type(ttype, target_dir=target_dir)
         if not abs_path.exists():
             abs_path.parent.mkdir(parents=True, exist_ok=True)
             with h5py.File(abs_path, "w") as f:
@@ -516,7 +672,8 @@ class TemplateService:
                 meta.attrs["W0"] = grid.min_wave
                 meta.attrs["W1"] = grid.max_wave
                 meta.attrs["DWLOG"] = grid.dlog
-                meta.create_dataset("standard_wavelength", data=self._standard_wave)
+                # The wavelength grid is not duplicated into every per-type file;
+                # readers regenerate it from NW/W0/DWLOG.
                 f.create_group("templates")
         return abs_path
 
@@ -537,10 +694,13 @@ class TemplateService:
 
         Returns (final_name, combined, epochs_count)
         """
+        h5py = _get_h5py()
         with h5py.File(h5_path, "a") as f:
             templates_group = f["templates"]
+            # Snapshot group names once; membership tests below stay in Python
+            existing_names = set(templates_group.keys())
             # Combine if same name exists and redshift matches
-            if name in templates_group:
+            if name in existing_names:
                 g = templates_group[name]
                 try:
                     existing_z = float(g.attrs.get("redshift", float("nan")))
@@ -550,26 +710,19 @@ class TemplateService:
                     # Multi-epoch combine (only if no duplicate epoch age)
                     # Check duplicate ages (tolerance)
                     age_tol = 1e-3
-                    duplicate_age = False
-                    existing_ages: list[float] = []
                     try:
                         if "epochs" in g:
-                            for ek in g["epochs"].keys():
-                                try:
-                                    existing_ages.append(float(g["epochs"][ek].attrs.get("age", float("nan"))))
-                                except Exception:
-                                    continue
+                            eg_existing = g["epochs"]
+                            existing_ages = np.fromiter(
+                                (self._attr_float(eg_existing[ek].attrs, "age") for ek in eg_existing.keys()),
+                                dtype=np.float64,
+                            )
                         else:
-                            existing_ages.append(float(g.attrs.get("age", float("nan"))))
-                    except Exception:
-                        existing_ages = []
-                    try:
-                        for ea in existing_ages:
-                            if np.isfinite(ea) and abs(ea - float(age)) < age_tol:
-                                duplicate_age = True
-                                break
+                            existing_ages = np.array([self._attr_float(g.attrs, "age")], dtype=np.float64)
                     except Exception:
-                        duplicate_age = False
+                        existing_ages = np.empty(0, dtype=np.float64)
+                    # NaN ages never compare below the tolerance, so no explicit isfinite mask is needed
+                    duplicate_age = bool(np.any(np.abs(existing_ages - float(age)) < age_tol))
                     if not duplicate_age:
                         # Ensure epochs group exists, move current data if needed
                         if "epochs" not in g:
@@ -621,12 +774,13 @@ class TemplateService:
             # Otherwise, create new (handle name collision by suffixing)
             final_name = name
             suffix = 1
-            while final_name in templates_group:
+            while final_name in existing_names:
                 if not allow_suffix:
                     return name, False, 0, "name_taken"
                 final_name = f"{name}_{suffix}"
                 suffix += 1
             g = templates_group.create_group(final_name)
+            existing_names.add(final_name)
             g.create_dataset("flux", data=flux)
             g.create_dataset("fft_real", data=np.asarray(fft.real))
             g.create_dataset("fft_imag", data=np.asarray(fft.imag))
@@ -649,6 +803,19 @@ class TemplateService:
                 meta.attrs["template_count"] = 1
             return final_name, False, 1, "created"
 
+    @staticmethod
+    def _norm_path(path: Path) -> str:
+        """Return the forward-slash form of a storage path, interned so entries from one file share it."""
+        return sys.intern(Path(path).as_posix())
+
+    @staticmethod
+    def _attr_float(attrs: Any, key: str) -> float:
+        """Read an HDF5 attribute as float, returning NaN when missing or unparseable."""
+        try:
+            return float(attrs.get(key, float("nan")))
+        except Exception:
+            return float("nan")
+
     def _index_path_for_target(self, target_dir: Optional[Path]) -> Optional[Path]:
         """Return the index path for the selected destination or the configured user folder."""
         if target_dir is not None:
@@ -681,11 +848,44 @@ class TemplateService:
         return None
 
     @staticmethod
-    def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    def _has_non_finite(obj: Any) -> bool:
+        """Return True if a JSON-able structure contains a NaN/inf float anywhere."""
+        if isinstance(obj, float):
+            return not math.isfinite(obj)
+        if isinstance(obj, dict):
+            return any(TemplateService._has_non_finite(v) for v in obj.values())
+        if isinstance(obj, (list, tuple)):
+            return any(TemplateService._has_non_finite(v) for v in obj)
+        return False
+
+    @classmethod
+    def _dumps_json(cls, data: Dict[str, Any]) -> bytes:
+        """Serialize an index to UTF-8 JSON bytes (orjson when available).
+
+        orjson output is JSON-equivalent to ``json.dumps(indent=2)`` but not
+        byte-identical (raw UTF-8 instead of ``\\u`` escapes, different float
+        spelling). orjson writes NaN/inf as ``null``, which would read back as
+        None, so indices holding non-finite floats go through stdlib json.
+        """
+        if ORJSON_AVAILABLE and not cls._has_non_finite(data):
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            except TypeError:
+                # Fall through to stdlib for values orjson does not handle
+                pass
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    @classmethod
+    def _write_json_atomic(cls, path: Path, data: Dict[str, Any]) -> None:
+        # Serialize before touching the filesystem so the file is open only for one write.
+        # Callers hold _index_lock: the index is read-modify-written, and a write
+        # serialized after releasing the lock could land after (and clobber) a newer
+        # concurrent update, so serialization stays under the lock.
+        payload = cls._dumps_json(data)
         path.parent.mkdir(parents=True, exist_ok=True)
         tmp = path.with_suffix(path.suffix + ".tmp")
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with open(tmp, "wb") as f:
+            f.write(payload)
         tmp.replace(path)
 
 
@@ -8,7 +8,7 @@ Widget for creating new templates from spectra.
 import os
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 import numpy as np
 from PySide6 import QtWidgets, QtCore, QtGui
 
@@ -19,20 +19,6 @@ from snid_sage.interfaces.gui.components.widgets.flexible_number_input import cr
 from ..utils.layout_manager import get_template_layout_manager
 from ..services.template_service import get_template_service
 
-# Import main GUI preprocessing dialog if available
-try:
-    from snid_sage.interfaces.gui.components.pyside6_dialogs.preprocessing_dialog import PySide6PreprocessingDialog
-    MAIN_GUI_AVAILABLE = True
-except ImportError:
-    MAIN_GUI_AVAILABLE = False
-
-# SNID imports
-try:
-    from snid_sage.snid.snid import preprocess_spectrum
-    SNID_AVAILABLE = True
-except ImportError:
-    SNID_AVAILABLE = False
-
 # Import logging
 try:
     from snid_sage.shared.utils.logging import get_logger
@@ -42,13 +28,134 @@ except ImportError:
     _LOGGER = logging.getLogger('template_manager.creator')
 
 
+_FALLBACK_TYPES = ["Ia", "Ib", "Ic", "II", "AGN", "Galaxy", "Star"]
+
+# SNID core (and its dependency chain) is imported on first use so that opening
+# the creator does not pay for it unless preprocessing is actually requested.
+_preprocess_spectrum_fn: Optional[Callable] = None
+
+
+def _get_preprocess_spectrum() -> Optional[Callable]:
+    """Return snid.preprocess_spectrum, importing it on first call (None if unavailable)."""
+    global _preprocess_spectrum_fn
+    if _preprocess_spectrum_fn is None:
+        try:
+            from snid_sage.snid.snid import preprocess_spectrum
+        except ImportError:
+            return None
+        _preprocess_spectrum_fn = preprocess_spectrum
+    return _preprocess_spectrum_fn
+
+
+def _to_rest_frame(wave: np.ndarray, z: float, *, inplace: bool = False) -> np.ndarray:
+    """De-redshift a wavelength array by multiplying with 1/(1+z).
+
+    With ``inplace=True`` an owned, writeable floating-point array is scaled in
+    place (only pass arrays the caller just loaded and does not share).
+    """
+    if z == 0.0 or wave.size == 0:
+        return wave
+    inv = 1.0 / (1.0 + z)
+    if inplace and wave.flags.owndata and wave.flags.writeable and wave.dtype.kind == 'f':
+        np.multiply(wave, inv, out=wave)
+        return wave
+    return wave * inv
+
+
+class _PreprocessSignals(QtCore.QObject):
+    """Signals for _PreprocessRunnable (QRunnable is not a QObject and cannot emit)."""
+
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+
+
+class _PreprocessRunnable(QtCore.QRunnable):
+    """Load a spectrum, shift it to the rest frame and optionally run quick preprocessing.
+
+    Runs on the global QThreadPool; results are delivered through ``signals`` and
+    queued back to the GUI thread by Qt.
+    """
+
+    def __init__(self, load: Callable[[str], Tuple[np.ndarray, np.ndarray]], file_path: str, z: float, preprocess: bool):
+        super().__init__()
+        self.signals = _PreprocessSignals()
+        self._load = load
+        self._file_path = file_path
+        self._z = z
+        self._preprocess = preprocess
+
+    def run(self):
+        try:
+            wave, flux = self._load(self._file_path)
+            wave = _to_rest_frame(wave, self._z, inplace=True)
+            if self._preprocess:
+                preprocess_spectrum = _get_preprocess_spectrum()
+                processed_spectrum, trace = preprocess_spectrum(
+                    input_spectrum=(wave, flux),
+                    verbose=True
+                )
+                self.signals.finished.emit(processed_spectrum)
+            else:
+                self.signals.finished.emit((wave, flux))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class _LazyPopupComboBox(QtWidgets.QComboBox):
+    """Combo box that asks its owner to (re)build the item list right before the popup opens."""
+
+    def __init__(self, populate: Callable[[], None], parent=None):
+        super().__init__(parent)
+        self._populate = populate
+
+    def showPopup(self):
+        try:
+            self._populate()
+        except Exception:
+            pass
+        super().showPopup()
+
+
 class TemplateCreatorWidget(QtWidgets.QWidget):
     """Widget for creating new templates from spectra"""
     
+    # Keys checked (in priority order) for wave/flux in SNID preprocess and dialog results
+    _WAVE_KEYS = ('log_wave', 'processed_wave', 'wave', 'wavelength')
+    _FLUX_KEYS = ('tapered_flux', 'flat_flux', 'log_flux', 'processed_flux', 'flat', 'flux')
+    
+    # Main GUI preprocessing dialog class, imported on first use and shared by instances
+    _preprocessing_dialog_cls: Optional[type] = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_spectrum = None
         self.layout_manager = get_template_layout_manager()
+        # Existence of the selected spectrum path, refreshed when the path text changes;
+        # only used for the debounced button enablement (actions re-check the filesystem)
+        self._cached_path = ""
+        self._cached_path_exists = False
+        # Background load/preprocess job (None when idle)
+        self._preprocess_job: Optional[_PreprocessRunnable] = None
+        self._preprocess_job_quick = False
+        # Form checks are built once and run against a single _read_form_text() snapshot
+        self._validators: List[Tuple[Callable[[Dict[str, str]], bool], str]] = [
+            (lambda form: bool(form['name']), "Template name is required"),
+            (self._has_valid_subtype, "Subtype is required"),
+            (lambda form: bool(form['path']), "Spectrum file is required"),
+            (lambda form: self._path_exists_now(form['path']), "Spectrum file does not exist"),
+        ]
+        self._readiness_checks: List[Callable[[Dict[str, str]], bool]] = [
+            lambda form: bool(form['path']) and self._cached_path_exists,
+            lambda form: bool(form['name']),
+            lambda form: bool(form['subtype']),
+            self._has_valid_type,
+            lambda form: self._has_numeric_age_and_redshift(),
+        ]
+        # Coalesce bursts of edit signals into a single enablement recompute
+        self._enable_timer = QtCore.QTimer(self)
+        self._enable_timer.setSingleShot(True)
+        self._enable_timer.setInterval(60)
+        self._enable_timer.timeout.connect(self._do_update_actions_enabled)
         self.setup_ui()
         
     def setup_ui(self):
@@ -66,6 +173,8 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
         
         browse_btn = self.layout_manager.create_action_button("Browse", "📁")
         browse_btn.clicked.connect(self.browse_spectrum_file)
+        # Refresh the cached existence flag before anything that reads it
+        self.file_path_edit.textChanged.connect(self._on_path_changed)
         self.file_path_edit.textChanged.connect(self._update_actions_enabled)
         
         file_layout.addWidget(self.file_path_edit)
@@ -94,20 +203,18 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
         name_row_layout.addWidget(pick_existing_btn)
         self.type_combo = QtWidgets.QComboBox()
         self.type_combo.setEditable(True)
-        # Populate dynamically from merged index
+        # Populate dynamically from the service (one cached pass over the indices)
         try:
-            svc = get_template_service()
-            by_type = svc.get_merged_index().get('by_type', {})
-            dynamic_types = sorted(list(by_type.keys()))
-            if dynamic_types:
-                self.type_combo.addItems(dynamic_types)
-            else:
-                self.type_combo.addItems(["Ia", "Ib", "Ic", "II", "AGN", "Galaxy", "Star"])  # minimal fallback
+            dynamic_types, subtypes_by_type = get_template_service().get_types_and_subtypes()
         except Exception:
-            self.type_combo.addItems(["Ia", "Ib", "Ic", "II", "AGN", "Galaxy", "Star"])  # fallback
+            dynamic_types, subtypes_by_type = [], {}
+        if dynamic_types:
+            self.type_combo.addItems(dynamic_types)
+        else:
+            self.type_combo.addItems(_FALLBACK_TYPES)  # minimal fallback
         # Add sentinel option for creating a new type
         self._TYPE_NEW_LABEL = "New Type..."
-        if self._TYPE_NEW_LABEL not in [self.type_combo.itemText(i) for i in range(self.type_combo.count())]:
+        if self.type_combo.findText(self._TYPE_NEW_LABEL) < 0:
             self.type_combo.addItem(self._TYPE_NEW_LABEL)
         # Start with empty type selection and placeholder
         try:
@@ -117,30 +224,21 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
         except Exception:
             pass
         
-        # Build subtype map from built-in index (type -> list of known subtypes)
-        self._subtypes_by_type: Dict[str, List[str]] = {}
-        try:
-            svc = get_template_service()
-            builtin = svc.get_builtin_index()
-            for name, meta in (builtin.get('templates') or {}).items():
-                ttype = (meta or {}).get('type', 'Unknown')
-                st = (meta or {}).get('subtype', 'Unknown')
-                bucket = self._subtypes_by_type.setdefault(ttype, [])
-                if isinstance(st, str) and st not in bucket:
-                    bucket.append(st)
-            # Sort lists for nicer UX
-            for k in list(self._subtypes_by_type.keys()):
-                self._subtypes_by_type[k].sort()
-        except Exception:
-            self._subtypes_by_type = {}
+        # Subtype map from built-in index (type -> tuple of known subtypes); shared, read-only
+        self._subtypes_by_type: Dict[str, Tuple[str, ...]] = subtypes_by_type
 
         # Subtype control: editable combo box populated per selected type
         self._SUBTYPE_NEW_LABEL = "New Subtype..."
-        self.subtype_combo = QtWidgets.QComboBox()
+        # Items are built only when the dropdown opens (see _populate_subtype_options)
+        self._pending_subtype_type = ""
+        self._populated_subtype_key: Optional[Tuple[str, Tuple[str, ...]]] = None
+        self.subtype_combo = _LazyPopupComboBox(self._populate_subtype_options)
         self.subtype_combo.setEditable(True)
         self.subtype_combo.currentTextChanged.connect(self._update_actions_enabled)
-        # Update subtype options when type changes
-        self.type_combo.currentTextChanged.connect(self._on_type_changed)
+        # Picking an entry runs the full type handling (including the 'New Type...'
+        # sentinel); typed edits only refresh the subtype lock state and enablement
+        self.type_combo.activated.connect(self._on_type_activated)
+        self.type_combo.editTextChanged.connect(self._on_type_text_edited)
         # Initially locked until a type is selected
         try:
             self.subtype_combo.setEnabled(False)
@@ -188,8 +286,14 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
         self.quick_preprocess_btn = self.layout_manager.create_action_button("Quick Preprocessing", "⚡")
         self.quick_preprocess_btn.clicked.connect(self.run_quick_preprocessing)
         
+        self.preprocess_progress = QtWidgets.QProgressBar()
+        self.preprocess_progress.setRange(0, 0)  # indeterminate while a job runs
+        self.preprocess_progress.setTextVisible(False)
+        self.preprocess_progress.setVisible(False)
+        
         preprocess_layout.addWidget(self.preprocess_btn)
         preprocess_layout.addWidget(self.quick_preprocess_btn)
+        preprocess_layout.addWidget(self.preprocess_progress)
         
         layout.addWidget(preprocess_group)
         
@@ -205,7 +309,7 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
             self._on_type_changed("")
         except Exception:
             pass
-        self._update_actions_enabled()
+        self._do_update_actions_enabled()
         
     def browse_spectrum_file(self):
         """Browse for a spectrum file"""
@@ -227,41 +331,17 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
         if not self._is_ready_for_preprocessing():
             QtWidgets.QMessageBox.warning(self, "Missing Information", "Please select a spectrum and fill Name, Type, Subtype, Age, and Redshift before preprocessing.")
             return
-        if not MAIN_GUI_AVAILABLE:
+        if self._get_preprocessing_dialog_cls() is None:
             QtWidgets.QMessageBox.warning(self, "Feature Unavailable", "Advanced preprocessing requires main GUI components.")
             return
             
         spectrum_file = self.file_path_edit.text()
-        if not spectrum_file or not os.path.exists(spectrum_file):
+        if not spectrum_file or not self._path_exists_now(spectrum_file):
             QtWidgets.QMessageBox.warning(self, "No Spectrum", "Please select a valid spectrum file first.")
             return
             
-        try:
-            # Load spectrum data
-            wave, flux = self._load_spectrum(spectrum_file)
-            # Convert to rest frame using user-provided redshift
-            try:
-                z_input = float(self.redshift_spinbox.value())
-            except Exception:
-                z_input = 0.0
-            if z_input != 0.0 and wave.size > 0:
-                wave = wave / (1.0 + z_input)
-            
-            dialog = PySide6PreprocessingDialog(self, (wave, flux))
-            if dialog.exec() == QtWidgets.QDialog.Accepted:
-                # Tag as rest-frame so we do not apply de-redshift again on save
-                try:
-                    result = dict(dialog.result)
-                except Exception:
-                    result = dialog.result
-                if isinstance(result, dict):
-                    result['is_rest_frame'] = True
-                self.current_spectrum = result
-                QtWidgets.QMessageBox.information(self, "Success", "Preprocessing completed. You can now create the template.")
-                
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Error", f"Error in preprocessing: {e}")
-            _LOGGER.error(f"Preprocessing error: {e}")
+        # Load off the GUI thread; the dialog opens in _on_preprocess_job_finished
+        self._start_preprocess_job(spectrum_file, quick=False)
             
     def run_quick_preprocessing(self):
         """Run quick preprocessing with default parameters"""
@@ -269,38 +349,95 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, "Missing Information", "Please select a spectrum and fill Name, Type, Subtype, Age, and Redshift before preprocessing.")
             return
         spectrum_file = self.file_path_edit.text()
-        if not spectrum_file or not os.path.exists(spectrum_file):
+        if not spectrum_file or not self._path_exists_now(spectrum_file):
             QtWidgets.QMessageBox.warning(self, "No Spectrum", "Please select a valid spectrum file first.")
             return
             
-        if not SNID_AVAILABLE:
+        if _get_preprocess_spectrum() is None:
             QtWidgets.QMessageBox.warning(self, "Feature Unavailable", "Preprocessing requires SNID core components.")
             return
             
-        try:
-            # Load, convert to rest frame, then run quick preprocessing
-            wave, flux = self._load_spectrum(spectrum_file)
-            try:
-                z_input = float(self.redshift_spinbox.value())
-            except Exception:
-                z_input = 0.0
-            if z_input != 0.0 and wave.size > 0:
-                wave = wave / (1.0 + z_input)
-            processed_spectrum, trace = preprocess_spectrum(
-                input_spectrum=(wave, flux),
-                verbose=True
-            )
+        # Load, convert to rest frame, then run quick preprocessing off the GUI thread
+        self._start_preprocess_job(spectrum_file, quick=True)
             
+    def _get_preprocessing_dialog_cls(self) -> Optional[type]:
+        """Return the main GUI preprocessing dialog class, importing it on first call."""
+        cls = type(self)._preprocessing_dialog_cls
+        if cls is None:
+            try:
+                from snid_sage.interfaces.gui.components.pyside6_dialogs.preprocessing_dialog import PySide6PreprocessingDialog
+            except ImportError:
+                return None
+            cls = type(self)._preprocessing_dialog_cls = PySide6PreprocessingDialog
+        return cls
+
+    def _start_preprocess_job(self, spectrum_file: str, *, quick: bool) -> None:
+        """Start a background load (and quick preprocessing when ``quick``) of the spectrum."""
+        if self._preprocess_job is not None:
+            return
+        try:
+            z_input = float(self.redshift_spinbox.value())
+        except Exception:
+            z_input = 0.0
+        job = _PreprocessRunnable(self._load_spectrum, spectrum_file, z_input, preprocess=quick)
+        # Lifetime is managed from Python (self._preprocess_job) so the signal holder
+        # survives until the queued result reaches the GUI thread
+        job.setAutoDelete(False)
+        job.signals.finished.connect(self._on_preprocess_job_finished)
+        job.signals.failed.connect(self._on_preprocess_job_failed)
+        self._preprocess_job = job
+        self._preprocess_job_quick = quick
+        self._set_preprocess_busy(True)
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _set_preprocess_busy(self, busy: bool) -> None:
+        """Show/hide the progress bar and lock the action buttons while a job runs."""
+        if not busy:
+            self._preprocess_job = None
+        self.preprocess_progress.setVisible(busy)
+        self._do_update_actions_enabled()
+
+    @QtCore.Slot(object)
+    def _on_preprocess_job_finished(self, result) -> None:
+        """Receive the background job result on the GUI thread."""
+        quick = self._preprocess_job_quick
+        self._set_preprocess_busy(False)
+        if quick:
             # Tag as rest-frame
-            if isinstance(processed_spectrum, dict):
-                processed_spectrum['is_rest_frame'] = True
-            self.current_spectrum = processed_spectrum
+            if isinstance(result, dict):
+                result['is_rest_frame'] = True
+            self.current_spectrum = result
             QtWidgets.QMessageBox.information(self, "Success", "Quick preprocessing completed. You can now create the template.")
-            
+            return
+        try:
+            wave, flux = result
+            dialog = self._get_preprocessing_dialog_cls()(self, (wave, flux))
+            if dialog.exec() == QtWidgets.QDialog.Accepted:
+                # Tag as rest-frame so we do not apply de-redshift again on save
+                try:
+                    spectrum = dict(dialog.result)
+                except Exception:
+                    spectrum = dialog.result
+                if isinstance(spectrum, dict):
+                    spectrum['is_rest_frame'] = True
+                self.current_spectrum = spectrum
+                QtWidgets.QMessageBox.information(self, "Success", "Preprocessing completed. You can now create the template.")
         except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Error", f"Error in quick preprocessing: {e}")
-            _LOGGER.error(f"Quick preprocessing error: {e}")
-            
+            QtWidgets.QMessageBox.critical(self, "Error", f"Error in preprocessing: {e}")
+            _LOGGER.error(f"Preprocessing error: {e}")
+
+    @QtCore.Slot(str)
+    def _on_preprocess_job_failed(self, message: str) -> None:
+        """Report a background job failure on the GUI thread."""
+        quick = self._preprocess_job_quick
+        self._set_preprocess_busy(False)
+        if quick:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Error in quick preprocessing: {message}")
+            _LOGGER.error(f"Quick preprocessing error: {message}")
+        else:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Error in preprocessing: {message}")
+            _LOGGER.error(f"Preprocessing error: {message}")
+
     def create_template(self):
         """Create the template with current settings"""
         # Ensure user templates folder is configured; prompt if not
@@ -317,22 +454,23 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
             return
 
         # Validate inputs
-        if not self.name_edit.text().strip():
+        form = self._read_form_text()
+        if not form['name']:
             QtWidgets.QMessageBox.warning(self, "Missing Information", "Please enter a template name.")
             return
-        if not self.subtype_combo.currentText().strip() or self.subtype_combo.currentText().strip() == self._SUBTYPE_NEW_LABEL:
+        if not self._has_valid_subtype(form):
             QtWidgets.QMessageBox.warning(self, "Missing Information", "Please enter a subtype.")
             return
             
-        if not self.file_path_edit.text() or not os.path.exists(self.file_path_edit.text()):
+        if not form['path'] or not self._path_exists_now(form['path']):
             QtWidgets.QMessageBox.warning(self, "Missing File", "Please select a valid spectrum file.")
             return
             
         # Prepare template metadata
         template_info = {
-            'name': self.name_edit.text().strip(),
-            'type': self.type_combo.currentText(),
-            'subtype': self.subtype_combo.currentText().strip() or 'Unknown',
+            'name': form['name'],
+            'type': form['type'],
+            'subtype': form['subtype'] or 'Unknown',
             'age': self.age_spinbox.value(),
             'redshift': self.redshift_spinbox.value(),
             'epochs': 1
@@ -344,9 +482,10 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
                 spectrum_data = self.current_spectrum
             else:
                 # Load spectrum and apply quick preprocessing
-                wave, flux = self._load_spectrum(self.file_path_edit.text())
+                wave, flux = self._load_spectrum(form['path'])
                 
-                if SNID_AVAILABLE:
+                preprocess_spectrum = _get_preprocess_spectrum()
+                if preprocess_spectrum is not None:
                     processed_spectrum, trace = preprocess_spectrum(
                         input_spectrum=(wave, flux),
                         verbose=False
@@ -354,34 +493,28 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
                     spectrum_data = processed_spectrum
                 else:
                     # Simple dictionary structure if SNID not available
+                    med = float(np.median(flux))
                     spectrum_data = {
                         'wave': wave,
                         'flux': flux,
                         'fluxed': flux,
-                        'flat': flux / np.median(flux)
+                        # Share the buffer when already normalized; otherwise one reciprocal multiply
+                        'flat': flux if med == 1.0 else flux * (1.0 / med)
                     }
             
             # Extract wave/flux arrays (support keys from SNID preprocess and dialog) without using boolean-or on arrays
             wave = None
             flux = None
             if isinstance(spectrum_data, dict):
-                for key in ['log_wave', 'processed_wave', 'wave', 'wavelength']:
-                    v = spectrum_data.get(key)
-                    if v is not None:
-                        wave = v
-                        break
-                for key in ['tapered_flux', 'flat_flux', 'log_flux', 'processed_flux', 'flat', 'flux']:
-                    v = spectrum_data.get(key)
-                    if v is not None:
-                        flux = v
-                        break
+                wave = next((spectrum_data[k] for k in self._WAVE_KEYS if spectrum_data.get(k) is not None), None)
+                flux = next((spectrum_data[k] for k in self._FLUX_KEYS if spectrum_data.get(k) is not None), None)
             elif isinstance(spectrum_data, (list, tuple)) and len(spectrum_data) >= 2:
                 wave, flux = spectrum_data[0], spectrum_data[1]
             if wave is None or flux is None:
                 raise ValueError("No valid wave/flux in spectrum data")
 
-            wave = np.asarray(wave, dtype=float)
-            flux = np.asarray(flux, dtype=float)
+            wave = np.ascontiguousarray(wave, dtype=np.float32)
+            flux = np.ascontiguousarray(flux, dtype=np.float32)
 
             # De-redshift to rest-frame if needed (skip if already rest frame)
             already_rest = False
@@ -395,8 +528,7 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
                     z_input = float(template_info.get('redshift', 0.0) or 0.0)
                 except Exception:
                     z_input = 0.0
-                if z_input != 0.0 and wave.size > 0:
-                    wave = wave / (1.0 + z_input)
+                wave = _to_rest_frame(wave, z_input)
 
             # Persist via HDF5-only service
             svc = get_template_service()
@@ -456,16 +588,20 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
         self.current_spectrum = None
         self._update_actions_enabled()
         
-    def _load_spectrum(self, file_path: str) -> Tuple[np.ndarray, np.ndarray]:
-        """Load spectrum from file"""
+    def _load_spectrum(self, file_path: str, dtype=np.float32) -> Tuple[np.ndarray, np.ndarray]:
+        """Load spectrum from file.
+
+        Arrays are returned as ``dtype`` (single precision by default, which is
+        ample for template creation; the template service upcasts when rebinning).
+        """
         try:
             # Try different file formats (LNW removed)
             if file_path.endswith('.fits'):
-                return self._load_fits_spectrum(file_path)
+                return self._load_fits_spectrum(file_path, dtype=dtype)
             elif file_path.endswith('.flm'):
-                return self._load_ascii_spectrum(file_path)  # FLM files are text-based
+                return self._load_ascii_spectrum(file_path, dtype=dtype)  # FLM files are text-based
             else:
-                return self._load_ascii_spectrum(file_path)
+                return self._load_ascii_spectrum(file_path, dtype=dtype)
         except Exception as e:
             _LOGGER.error(f"Error loading spectrum: {e}")
             # Return dummy data on error
@@ -473,43 +609,68 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
             flux = np.random.normal(1, 0.1, 1000)
             return wave, flux
             
-    def _load_fits_spectrum(self, file_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    def _load_fits_spectrum(self, file_path: str, dtype=np.float32) -> Tuple[np.ndarray, np.ndarray]:
         """Load spectrum from FITS file"""
         try:
             from astropy.io import fits
-            with fits.open(file_path) as hdul:
+            # Memory-map and load HDUs on demand; stop at the first HDU with data
+            with fits.open(file_path, memmap=True, lazy_load_hdus=True) as hdul:
                 # Try to find spectrum data in different extensions
                 for hdu in hdul:
-                    if hdu.data is not None:
-                        data = hdu.data
-                        if len(data.shape) == 1:
-                            # 1D spectrum - assume wavelength is indices
-                            flux = data
-                            wave = np.arange(len(flux)) + 1
-                            return wave, flux
-                        elif len(data.shape) == 2:
-                            # 2D - assume first column is wavelength, second is flux
-                            wave = data[:, 0]
-                            flux = data[:, 1]
-                            return wave, flux
+                    if hdu.data is None:
+                        continue
+                    data = hdu.data
+                    # Copy out of the memmap (np.array copies) before the file closes
+                    if len(data.shape) == 1:
+                        # 1D spectrum - assume wavelength is indices
+                        flux = np.array(data, dtype=dtype)
+                        wave = np.arange(1, len(flux) + 1, dtype=dtype)
+                        return wave, flux
+                    elif len(data.shape) == 2:
+                        # 2D - assume first column is wavelength, second is flux
+                        wave = np.array(data[:, 0], dtype=dtype)
+                        flux = np.array(data[:, 1], dtype=dtype)
+                        return wave, flux
         except ImportError:
             raise ImportError("astropy required for FITS files: pip install astropy")
             
     # LNW loading removed
         
-    def _load_ascii_spectrum(self, file_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    def _load_ascii_spectrum(self, file_path: str, dtype=np.float32) -> Tuple[np.ndarray, np.ndarray]:
         """Load spectrum from ASCII file"""
         try:
-            # Try to load as two-column ASCII
-            data = np.loadtxt(file_path)
+            # Peek at the first data line to pick the columns up front, so the
+            # full parse happens once and ignores any extra (e.g. error) columns
+            ncols = 0
+            with open(file_path, "r") as fh:
+                for line in fh:
+                    stripped = line.strip()
+                    if not stripped or stripped.startswith('#'):
+                        continue
+                    ncols = len(stripped.split())
+                    break
+            usecols = (0, 1) if ncols >= 2 else (0,)
+
+            # Prefer pandas' C tokenizer; fall back to numpy for anything it rejects
+            data = None
+            try:
+                import pandas as pd
+                data = pd.read_csv(
+                    file_path, sep=r"\s+", header=None, comment="#", usecols=list(usecols),
+                    dtype=dtype, engine="c"
+                ).to_numpy()
+            except Exception:
+                data = None
+            if data is None:
+                data = np.loadtxt(file_path, ndmin=2, usecols=usecols, dtype=dtype)
             if data.shape[1] >= 2:
                 wave = data[:, 0]
                 flux = data[:, 1]
                 return wave, flux
             else:
                 # Single column - assume flux only
-                flux = data
-                wave = np.arange(len(flux)) + 1
+                flux = data[:, 0]
+                wave = np.arange(1, len(flux) + 1, dtype=dtype)
                 return wave, flux
         except Exception as e:
             raise ValueError(f"Could not load ASCII spectrum: {e}")
@@ -523,54 +684,77 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
     
     def get_current_template_info(self) -> Dict[str, Any]:
         """Get the current template information from the form"""
+        form = self._read_form_text()
         return {
-            'name': self.name_edit.text().strip(),
-            'type': self.type_combo.currentText(),
-            'subtype': self.subtype_combo.currentText().strip() or 'Unknown',
+            'name': form['name'],
+            'type': form['type'],
+            'subtype': form['subtype'] or 'Unknown',
             'age': self.age_spinbox.value(),
             'redshift': self.redshift_spinbox.value(),
-            'spectrum_file': self.file_path_edit.text()
+            'spectrum_file': form['path']
         }
     
     def validate_form(self) -> Tuple[bool, str]:
         """Validate the current form state"""
-        if not self.name_edit.text().strip():
-            return False, "Template name is required"
-        if not self.subtype_combo.currentText().strip() or self.subtype_combo.currentText().strip() == self._SUBTYPE_NEW_LABEL:
-            return False, "Subtype is required"
-        
-        if not self.file_path_edit.text():
-            return False, "Spectrum file is required"
-        
-        if not os.path.exists(self.file_path_edit.text()):
-            return False, "Spectrum file does not exist"
-        
+        form = self._read_form_text()
+        for predicate, message in self._validators:
+            if not predicate(form):
+                return False, message
         return True, "Form is valid"
 
     # ---- helpers ----
+    def _on_path_changed(self, text: str) -> None:
+        """Re-probe the filesystem once per path edit and cache the result."""
+        self._cached_path = text
+        self._cached_path_exists = os.path.exists(text) if text else False
+
+    def _path_exists_now(self, path: str) -> bool:
+        """Stat the path again (the file may have moved since it was picked) and refresh the cache."""
+        exists = os.path.exists(path) if path else False
+        if path == self._cached_path and exists != self._cached_path_exists:
+            self._cached_path_exists = exists
+            self._update_actions_enabled()
+        return exists
+
     def _is_ready_for_preprocessing(self) -> bool:
         """Check that required fields are filled before preprocessing."""
-        if not (self.file_path_edit.text() and os.path.exists(self.file_path_edit.text())):
-            return False
-        if not self.name_edit.text().strip():
-            return False
-        if not self.subtype_combo.currentText().strip():
-            return False
-        # type combo always has a selection; ensure text is not empty
-        # type combo must be non-empty and not the sentinel
-        if not self.type_combo.currentText().strip() or self.type_combo.currentText().strip() == self._TYPE_NEW_LABEL:
-            return False
-        # age/redshift are numeric; just ensure widgets exist
+        form = self._read_form_text()
+        return all(check(form) for check in self._readiness_checks)
+
+    def _read_form_text(self) -> Dict[str, str]:
+        """Read the text widgets once: stripped name/subtype, raw type and spectrum path."""
+        return {
+            'name': self.name_edit.text().strip(),
+            'type': self.type_combo.currentText(),
+            'subtype': self.subtype_combo.currentText().strip(),
+            'path': self.file_path_edit.text(),
+        }
+
+    def _has_valid_subtype(self, form: Dict[str, str]) -> bool:
+        """Subtype must be non-empty and not the 'New Subtype...' sentinel."""
+        return bool(form['subtype']) and form['subtype'] != self._SUBTYPE_NEW_LABEL
+
+    def _has_valid_type(self, form: Dict[str, str]) -> bool:
+        """Type must be non-empty and not the 'New Type...' sentinel."""
+        ttype = form['type'].strip()
+        return bool(ttype) and ttype != self._TYPE_NEW_LABEL
+
+    def _has_numeric_age_and_redshift(self) -> bool:
+        """Age/redshift are numeric; just ensure widgets yield floats."""
         try:
-            _ = float(self.age_spinbox.value())
-            _ = float(self.redshift_spinbox.value())
+            float(self.age_spinbox.value())
+            float(self.redshift_spinbox.value())
         except Exception:
             return False
         return True
 
     def _update_actions_enabled(self) -> None:
+        """Schedule a (debounced) refresh of the action buttons' enabled state."""
+        self._enable_timer.start()
+
+    def _do_update_actions_enabled(self) -> None:
         """Enable/disable preprocessing and create buttons based on form state."""
-        ready = self._is_ready_for_preprocessing()
+        ready = self._is_ready_for_preprocessing() and self._preprocess_job is None
         try:
             self.preprocess_btn.setEnabled(ready)
             self.quick_preprocess_btn.setEnabled(ready)
@@ -655,42 +839,48 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
         except Exception:
             pass
 
+    def _on_type_activated(self, index: int) -> None:
+        """Handle an explicit selection from the type dropdown."""
+        self._on_type_changed(self.type_combo.itemText(index))
+
+    def _on_type_text_edited(self, text: str) -> None:
+        """Handle typed/programmatic type edits; the sentinel is left to _on_type_activated."""
+        if (text or "").strip() == self._TYPE_NEW_LABEL:
+            return
+        self._on_type_changed(text)
+
     def _on_type_changed(self, ttype: str) -> None:
-        """Update subtype combo items based on selected type."""
+        """Lock/unlock the subtype combo for the selected type.
+
+        Subtype items are not rebuilt here; _populate_subtype_options() fills them
+        when the dropdown is opened. Items left over from another type are dropped
+        so the completer and arrow-key navigation cannot offer them.
+        """
         normalized = (ttype or "").strip()
-        try:
-            current_text = self.subtype_combo.currentText().strip()
-        except Exception:
-            current_text = ""
-        try:
-            self.subtype_combo.blockSignals(True)
-            self.subtype_combo.clear()
-            # Lock subtype if no type chosen
+        self._pending_subtype_type = normalized
+        with QtCore.QSignalBlocker(self.subtype_combo):
+            stale = self._populated_subtype_key
+            if stale is not None and stale[0] != normalized:
+                current_text = self.subtype_combo.currentText()
+                self.subtype_combo.clear()
+                self.subtype_combo.setEditText(current_text)
+                self._populated_subtype_key = None
             if not normalized:
+                # Lock subtype if no type chosen
+                self.subtype_combo.setEditText("")
                 self.subtype_combo.setEnabled(False)
                 if self.subtype_combo.lineEdit():
                     self.subtype_combo.lineEdit().setPlaceholderText("Select type first")
-                return
-            # Enable subtype once a type is present
-            self.subtype_combo.setEnabled(True)
-            # If the user selected the sentinel for new type, encourage entering new subtype
-            if normalized == self._TYPE_NEW_LABEL or normalized not in self._subtypes_by_type:
-                self.subtype_combo.addItem(self._SUBTYPE_NEW_LABEL)
-                if self.subtype_combo.lineEdit():
-                    self.subtype_combo.lineEdit().setPlaceholderText("Enter new subtype")
-                self.subtype_combo.setEditText("")
-                return
-            options = list(self._subtypes_by_type.get(normalized, []))
-            if options:
-                self.subtype_combo.addItems(options)
-            # Preserve user-entered text if any
-            if current_text and current_text not in options:
-                self.subtype_combo.setEditText(current_text)
-        finally:
-            try:
-                self.subtype_combo.blockSignals(False)
-            except Exception:
-                pass
+            else:
+                # Enable subtype once a type is present
+                self.subtype_combo.setEnabled(True)
+                # If the user selected the sentinel for new type, encourage entering new subtype
+                if normalized == self._TYPE_NEW_LABEL or normalized not in self._subtypes_by_type:
+                    if self.subtype_combo.lineEdit():
+                        self.subtype_combo.lineEdit().setPlaceholderText("Enter new subtype")
+                    self.subtype_combo.setEditText("")
+                elif self.subtype_combo.lineEdit():
+                    self.subtype_combo.lineEdit().setPlaceholderText("Select or enter a subtype")
         # Also if user picked the 'New Type...' sentinel, focus edit for typing
         if normalized == self._TYPE_NEW_LABEL:
             try:
@@ -698,4 +888,26 @@ class TemplateCreatorWidget(QtWidgets.QWidget):
             except Exception:
                 pass
         # Update action enablement after type change
-        self._update_actions_enabled()
\ No newline at end of file
+        self._update_actions_enabled()
+
+    def _populate_subtype_options(self) -> None:
+        """Fill the subtype dropdown for the current type; skipped when already up to date."""
+        normalized = self._pending_subtype_type
+        if not normalized:
+            return
+        if normalized == self._TYPE_NEW_LABEL or normalized not in self._subtypes_by_type:
+            options: Tuple[str, ...] = (self._SUBTYPE_NEW_LABEL,)
+        else:
+            options = self._subtypes_by_type.get(normalized, ())
+        key = (normalized, options)
+        if key == self._populated_subtype_key:
+            return
+        # Preserve user-entered text across the rebuild
+        current_text = self.subtype_combo.currentText()
+        with QtCore.QSignalBlocker(self.subtype_combo):
+            self.subtype_combo.clear()
+            if options:
+                self.subtype_combo.addItems(list(options))
+            self.subtype_combo.setCurrentIndex(-1)
+            self.subtype_combo.setEditText(current_text)
+        self._populated_subtype_key = key
@@ -6,7 +6,7 @@ Advanced template management tools for batch operations and editing.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from PySide6 import QtWidgets, QtCore, QtGui
 
 # Import flexible number input widget
@@ -25,17 +25,56 @@ except ImportError:
     _LOGGER = logging.getLogger('template_manager.manager')
 
 
+class _ServiceCallSignals(QtCore.QObject):
+    """Signals for _ServiceCallRunnable (QRunnable is not a QObject and cannot emit)."""
+
+    finished = QtCore.Signal(bool)
+
+
+class _ServiceCallRunnable(QtCore.QRunnable):
+    """Run a blocking template-service call (save/delete) on the global QThreadPool.
+
+    The boolean result is delivered through ``signals`` and queued back to the
+    GUI thread by Qt; exceptions are reported as ``False``.
+    """
+
+    def __init__(self, call: Callable[[], bool]):
+        super().__init__()
+        self.signals = _ServiceCallSignals()
+        self._call = call
+
+    def run(self):
+        try:
+            ok = bool(self._call())
+        except Exception as e:
+            _LOGGER.error(f"Template service call failed: {e}")
+            ok = False
+        self.signals.finished.emit(ok)
+
+
 class TemplateManagerWidget(QtWidgets.QWidget):
     """Advanced template management tools"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.layout_manager = get_template_layout_manager()
+        self._svc = get_template_service()
+        # In-flight save/delete (at most one); see _start_service_job
+        self._service_job: Optional[_ServiceCallRunnable] = None
+        self._pending_name = ""
+        self._edit_is_user = True
+        # Coalesce bursts of empty-state checks into one per event-loop pass
+        self._empty_state_timer = QtCore.QTimer(self)
+        self._empty_state_timer.setSingleShot(True)
+        self._empty_state_timer.setInterval(0)
+        self._empty_state_timer.timeout.connect(self._do_update_empty_state)
+        # Debounce library refreshes requested by save/delete/import
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._do_refresh)
         self.setup_ui()
-        try:
-            self.update_empty_state()
-        except Exception:
-            pass
+        self._do_update_empty_state()
         
     def setup_ui(self):
         """Setup the management interface"""
@@ -67,17 +106,8 @@ class TemplateManagerWidget(QtWidgets.QWidget):
         
         self.edit_name = QtWidgets.QLineEdit()
         self.edit_type = QtWidgets.QComboBox()
-        # Populate dynamically from merged index
-        try:
-            svc = get_template_service()
-            by_type = svc.get_merged_index().get('by_type', {})
-            dynamic_types = sorted(list(by_type.keys()))
-            if dynamic_types:
-                self.edit_type.addItems(dynamic_types)
-            else:
-                self.edit_type.addItems(["Ia", "Ib", "Ic", "II", "AGN", "Galaxy", "Star"])  # minimal fallback
-        except Exception:
-            self.edit_type.addItems(["Ia", "Ib", "Ic", "II", "AGN", "Galaxy", "Star"])  # fallback
+        # Items are filled on first show (or first edit) to keep startup light
+        self._types_populated = False
         self.edit_subtype = QtWidgets.QLineEdit()
         self.edit_age = create_flexible_double_input(min_val=-999.9, max_val=999.9, suffix=" days", default=0.0)
         
@@ -99,6 +129,8 @@ class TemplateManagerWidget(QtWidgets.QWidget):
         delete_btn.clicked.connect(self.delete_template)
         delete_btn.setStyleSheet("QPushButton { background-color: #dc2626; color: white; }")
         
+        self._save_btn = save_btn
+        self._delete_btn = delete_btn
         action_layout.addWidget(save_btn)
         action_layout.addWidget(delete_btn)
         
@@ -113,6 +145,24 @@ class TemplateManagerWidget(QtWidgets.QWidget):
         
         layout.addStretch()
         
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        self._ensure_types_populated()
+
+    def _ensure_types_populated(self) -> None:
+        """Populate the type combo once from the service's cached (pre-sorted) type list."""
+        if self._types_populated:
+            return
+        self._types_populated = True
+        try:
+            dynamic_types = self._svc.get_types_and_subtypes()[0]
+        except Exception:
+            dynamic_types = []
+        with QtCore.QSignalBlocker(self.edit_type):
+            self.edit_type.clear()
+            self.edit_type.addItems(dynamic_types or ["Ia", "Ib", "Ic", "II", "AGN", "Galaxy", "Star"])  # minimal fallback
+        self.edit_type.setCurrentIndex(0)
+        
     # Batch operations and related dialogs removed
     def open_batch_import_dialog(self) -> None:
         """Open the batch import dialog for creating templates from CSV/TSV."""
@@ -130,18 +180,24 @@ class TemplateManagerWidget(QtWidgets.QWidget):
         
     def save_template_changes(self):
         """Save changes to template metadata"""
-        if not self.edit_name.text().strip():
+        name = self.edit_name.text().strip()
+        if not name:
             QtWidgets.QMessageBox.warning(self, "Validation Error", "Template name cannot be empty.")
             return
-        svc = get_template_service()
-        ok = svc.update_metadata(
-            self.edit_name.text().strip(),
-            {
-                'type': self.edit_type.currentText(),
-                'subtype': self.edit_subtype.text().strip(),
-                'age': float(self.edit_age.value()),
-            }
-        )
+        if self._service_job is not None:
+            return
+        changes = {
+            'type': self.edit_type.currentText(),
+            'subtype': self.edit_subtype.text().strip(),
+            'age': float(self.edit_age.value()),
+        }
+        svc = self._svc
+        self._start_service_job(name, lambda: svc.update_metadata(name, changes), self._on_save_done)
+
+    @QtCore.Slot(bool)
+    def _on_save_done(self, ok: bool) -> None:
+        """Report the result of a background save on the GUI thread."""
+        self._set_service_busy(False)
         if ok:
             QtWidgets.QMessageBox.information(self, "Save", "Template metadata saved successfully!")
             self._emit_refresh()
@@ -151,9 +207,12 @@ class TemplateManagerWidget(QtWidgets.QWidget):
         
     def delete_template(self):
         """Delete selected template"""
-        if not self.edit_name.text().strip():
+        name = self.edit_name.text().strip()
+        if not name:
             QtWidgets.QMessageBox.warning(self, "Selection Error", "No template selected for deletion.")
             return
+        if self._service_job is not None:
+            return
         
         reply = QtWidgets.QMessageBox.question(
             self, 
@@ -162,28 +221,62 @@ class TemplateManagerWidget(QtWidgets.QWidget):
             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
         )
         if reply == QtWidgets.QMessageBox.Yes:
-            svc = get_template_service()
-            if svc.delete(self.edit_name.text().strip()):
-                QtWidgets.QMessageBox.information(self, "Deleted", f"Template '{self.edit_name.text()}' deleted successfully!")
+            svc = self._svc
+            self._start_service_job(name, lambda: svc.delete(name), self._on_delete_done)
+            return
+        self.update_empty_state()
+
+    @QtCore.Slot(bool)
+    def _on_delete_done(self, ok: bool) -> None:
+        """Report the result of a background delete on the GUI thread."""
+        name = self._pending_name
+        self._set_service_busy(False)
+        if ok:
+            QtWidgets.QMessageBox.information(self, "Deleted", f"Template '{name}' deleted successfully!")
+            if self.edit_name.text().strip() == name:
                 self._clear_form()
-                self._emit_refresh()
-            else:
-                QtWidgets.QMessageBox.critical(self, "Error", "Failed to delete (only user templates can be deleted).")
+            self._emit_refresh()
+        else:
+            QtWidgets.QMessageBox.critical(self, "Error", "Failed to delete (only user templates can be deleted).")
         self.update_empty_state()
+
+    def _start_service_job(self, name: str, call: Callable[[], bool], on_done: Callable[[bool], None]) -> None:
+        """Run a save/delete off the GUI thread; ``on_done`` receives the result.
+
+        The tree reload, empty-state check and ``user_template_names`` keep
+        reading the service meanwhile; its index caches are safe against the
+        concurrent write (see ``TemplateService``).
+        """
+        job = _ServiceCallRunnable(call)
+        # Lifetime is managed from Python (self._service_job) so the signal holder
+        # survives until the queued result reaches the GUI thread
+        job.setAutoDelete(False)
+        job.signals.finished.connect(on_done)
+        self._service_job = job
+        self._pending_name = name
+        self._set_service_busy(True)
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _set_service_busy(self, busy: bool) -> None:
+        """Lock the Save/Delete buttons while a service call is in flight."""
+        if not busy:
+            self._service_job = None
+        enabled = self._edit_is_user and not busy
+        self._save_btn.setEnabled(enabled)
+        self._delete_btn.setEnabled(enabled)
             
     # Advanced operations and duplication removed
     
     def set_template_for_editing(self, template_name: str, template_info: Dict[str, Any]):
         """Set a template for editing"""
+        self._ensure_types_populated()
         self.edit_name.setText(template_name)
         self.edit_type.setCurrentText(template_info.get('type', 'Other'))
         self.edit_subtype.setText(template_info.get('subtype', ''))
         self.edit_age.setValue(template_info.get('age', 0.0))
         # Disable editing controls if this is a built-in template (not in user index)
         try:
-            svc = get_template_service()
-            user_templates = (svc.get_user_index().get('templates') or {})
-            is_user = template_name in user_templates
+            is_user = template_name in self._svc.user_template_names()
         except Exception:
             is_user = False
         # Enable/disable inputs and buttons accordingly
@@ -191,12 +284,9 @@ class TemplateManagerWidget(QtWidgets.QWidget):
             editable_widgets = [self.edit_type, self.edit_subtype, self.edit_age]
             for w in editable_widgets:
                 w.setEnabled(is_user)
-            # Find buttons in the action frame by walking children
-            for btn in self.findChildren(QtWidgets.QPushButton):
-                if btn.text().strip().lower().startswith('save'):
-                    btn.setEnabled(is_user)
-                if btn.text().strip().lower().startswith('delete'):
-                    btn.setEnabled(is_user)
+            self._edit_is_user = is_user
+            self._save_btn.setEnabled(is_user and self._service_job is None)
+            self._delete_btn.setEnabled(is_user and self._service_job is None)
         except Exception:
             pass
     
@@ -208,6 +298,10 @@ class TemplateManagerWidget(QtWidgets.QWidget):
         self.edit_age.setValue(0.0)
 
     def _emit_refresh(self) -> None:
+        # Schedule a refresh; bursts within the timer interval collapse into one
+        self._refresh_timer.start()
+
+    def _do_refresh(self) -> None:
         # Notify parent main window to refresh tree and counts if available
         try:
             mw = self.window()
@@ -230,10 +324,13 @@ class TemplateManagerWidget(QtWidgets.QWidget):
         }
 
     def update_empty_state(self) -> None:
+        """Schedule a refresh of the empty-state message (coalesced)."""
+        self._empty_state_timer.start()
+
+    def _do_update_empty_state(self) -> None:
         """Show or hide the empty-state message based on presence of user templates."""
         try:
-            from ..services.template_service import get_template_service
-            has_user = get_template_service().has_user_templates()
+            has_user = self._svc.has_user_templates()
             self.empty_state_label.setVisible(not has_user)
         except Exception:
             # If check fails, hide label to avoid blocking UI
@@ -6,13 +6,17 @@ redshift and age estimation using template quality metrics.
 """
 
 from .weighted_statistics import (
+    WeightedInputs,
     calculate_combined_weights,
     apply_exponential_weighting,
     compute_cluster_weights,
     estimate_weighted_redshift,
     estimate_weighted_epoch,
     weighted_redshift_se,
-    weighted_epoch_se
+    weighted_epoch_se,
+    WeightedSummary,
+    weighted_summary,
+    weighted_summary_batch
 )
 
 from .similarity_metrics import (
@@ -28,6 +32,7 @@ from .similarity_metrics import (
 
 __all__ = [
     # Weighted statistics
+    'WeightedInputs',
     'calculate_combined_weights',
     'apply_exponential_weighting',
     'compute_cluster_weights',
@@ -35,6 +40,9 @@ __all__ = [
     'estimate_weighted_epoch',
     'weighted_redshift_se',
     'weighted_epoch_se',
+    'WeightedSummary',
+    'weighted_summary',
+    'weighted_summary_batch',
     # Similarity metrics
     'concordance_correlation_coefficient',
     'compute_rlap_ccc_metric',
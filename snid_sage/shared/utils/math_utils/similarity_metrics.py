@@ -101,7 +101,7 @@ def concordance_correlation_coefficient(spec1: np.ndarray, spec2: np.ndarray) ->
     # ρ = cov(x,y) / (σx * σy)
     # Use consistent ddof=1 for covariance calculation
     if a.size > 1:
-        cov_xy = float(np.sum((a - mu_x) * (b - mu_y)) / (a.size - 1))
+        cov_xy = float(np.dot(a - mu_x, b - mu_y) / (a.size - 1))
     else:
         cov_xy = 0.0
     std_x = float(np.sqrt(var_x))
@@ -958,7 +958,8 @@ def compute_chi_square_metric(
                     lin = np.maximum(np.abs(scaled) - d, 0.0)
                     chi2 = float(np.sum(quad * quad + 2 * d * lin))
                 else:
-                    chi2 = float(np.sum((resid * np.sqrt(w)) ** 2))
+                    # Σ w·resid² without the sqrt(w) and squared temporaries
+                    chi2 = float(np.einsum('i,i,i->', w, resid, resid))
                 dof = max(1, len(a_win) - 1)  # -1 for fitted alpha
                 red_chi2 = chi2 / float(dof)
 
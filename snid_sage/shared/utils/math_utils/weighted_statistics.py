@@ -5,8 +5,10 @@ This module implements best-metric weighted estimation methods (preferring RLAP-
 and age estimation with full covariance analysis.
 """
 
+import math
 import numpy as np
-from typing import Union, List, Tuple, Optional
+from dataclasses import dataclass
+from typing import Callable, NamedTuple, Union, List, Tuple, Optional
 import logging
 
 # Get logger for this module
@@ -25,14 +27,171 @@ def compute_cluster_weights(
     return calculate_combined_weights(rlap_ccc_values, redshift_errors)
 
 
+# NumPy callables used by the per-estimate reduction helpers below, bound once
+# so those small-array paths skip the module attribute lookups.
+_dot = np.dot
+_einsum = np.einsum
+_isfinite = np.isfinite
+_logical_and = np.logical_and
+_float64 = np.float64
+
+
+# Optional numba kernel for _weighted_moments; resolved lazily on first use
+# (None = not yet tried, False = unavailable, falls back to NumPy).
+_moments_kernel = None
+
+
+def _west_moments(x, w):
+    """Single-pass weighted moments (West's update): returns (Σw, μ, M2, Σw²).
+
+    Entries with non-finite x/w or w <= 0 are skipped inline, so raw arrays
+    need no separate validity mask.
+    """
+    sw = 0.0
+    sww = 0.0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(x.shape[0]):
+        wi = w[i]
+        if not (wi > 0.0) or not math.isfinite(wi) or not math.isfinite(x[i]):
+            continue
+        sw_new = sw + wi
+        d = x[i] - mean
+        mean += (wi / sw_new) * d
+        m2 += wi * d * (x[i] - mean)
+        sw = sw_new
+        sww += wi * wi
+    return sw, mean, m2, sww
+
+
+def _get_moments_kernel():
+    """Return the numba-compiled moments kernel, or None if numba is unavailable."""
+    global _moments_kernel
+    if _moments_kernel is None:
+        try:
+            from numba import njit
+            _moments_kernel = njit(cache=True)(_west_moments)
+        except Exception:
+            _moments_kernel = False
+    return _moments_kernel or None
+
+
+# Optional numba ufunc for the r^2 / sigma^2 weights; resolved lazily like
+# _moments_kernel (None = not yet tried, False = unavailable).
+_weights_ufunc = None
+
+
+def _sq_ratio(r, sigma):
+    """Element kernel for the cluster weight r^2 / sigma^2."""
+    return (r * r) / (sigma * sigma)
+
+
+def _get_weights_ufunc():
+    """Return the numba-vectorized weight ufunc, or None if numba is unavailable."""
+    global _weights_ufunc
+    if _weights_ufunc is None:
+        try:
+            from numba import vectorize
+            _weights_ufunc = vectorize(['float64(float64, float64)'], cache=True)(_sq_ratio)
+        except Exception:
+            _weights_ufunc = False
+    return _weights_ufunc or None
+
+
+def _wdot(a: np.ndarray, b: np.ndarray) -> float:
+    """Σ a_i b_i, accumulated in float64 even for reduced-precision inputs."""
+    if a.dtype == _float64 and b.dtype == _float64:
+        return float(_dot(a, b))
+    return float(np.multiply(a, b).sum(dtype=_float64))
+
+
+def _wsq(w: np.ndarray, d: np.ndarray) -> float:
+    """Σ w_i d_i² without a ``d**2`` temporary. ``d`` is scratch and may be overwritten."""
+    if w.dtype == _float64 and d.dtype == _float64:
+        return float(_einsum('i,i,i->', w, d, d))
+    d *= d
+    d *= w
+    return float(d.sum(dtype=_float64))
+
+
+def _weighted_moments(x: np.ndarray, w: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Fused weighted moments of ``x``: returns (Σw, μ, var_pop, Σw²).
+
+    Uses a compiled single-pass kernel when numba is installed; otherwise sums
+    are taken with ``np.dot`` so each reduction is a single BLAS pass and no
+    ``w * x`` / ``w * dev**2`` temporaries are materialised. float32 inputs
+    keep float32 working arrays but accumulate every sum in float64.
+    """
+    kernel = _get_moments_kernel()
+    if kernel is not None and x.dtype == _float64 and w.dtype == _float64:
+        sum_w, mean, m2, sum_w_sq = kernel(np.ascontiguousarray(x), np.ascontiguousarray(w))
+        if sum_w <= 0 or not math.isfinite(sum_w):
+            return sum_w, float('nan'), float('nan'), float('nan')
+        return float(sum_w), float(mean), float(m2) / sum_w, float(sum_w_sq)
+    sum_w = float(w.sum(dtype=_float64))
+    if sum_w <= 0 or not math.isfinite(sum_w):
+        return sum_w, float('nan'), float('nan'), float('nan')
+    mean = _wdot(w, x) / sum_w
+    dev = np.subtract(x, x.dtype.type(mean))  # the only per-call scratch buffer
+    var_pop = _wsq(w, dev) / sum_w
+    sum_w_sq = _wdot(w, w)
+    return sum_w, mean, var_pop, sum_w_sq
+
+
+def _as_float(a: Union[np.ndarray, List[float]]) -> np.ndarray:
+    """Contiguous float array without copying float32/float64 input.
+
+    Only lists and non-float arrays are converted (to float64); float32
+    callers stay in single precision, sums are still accumulated in float64.
+    """
+    arr = np.ascontiguousarray(a)
+    if arr.dtype != np.float64 and arr.dtype != np.float32:
+        arr = arr.astype(np.float64)
+    return arr
+
+
+def _valid_mask(positive: np.ndarray, *finite: np.ndarray) -> np.ndarray:
+    """Mask of entries with ``positive`` > 0 and every array in ``finite`` finite.
+
+    Built in place with one scratch buffer instead of one bool temporary per term.
+    """
+    mask = np.greater(positive, 0)
+    tmp = np.empty_like(mask)
+    for a in finite:
+        _logical_and(mask, _isfinite(a, out=tmp), out=mask)
+    return mask
+
+
+def _weights_from_valid(r: np.ndarray, sigma: np.ndarray) -> np.ndarray:
+    """
+    Cluster weights (r)^2 / sigma^2 for already-masked slices (finite, sigma > 0).
+
+    Same values as compute_cluster_weights: with every sigma positive its
+    0.1 × min(sigma) floor can never bind, so the floor scan is skipped.
+    """
+    ufunc = _get_weights_ufunc()
+    if ufunc is not None and r.dtype == _float64 and sigma.dtype == _float64:
+        # One fused element loop, one output buffer
+        return ufunc(r, sigma)
+    precision = sigma * sigma
+    np.reciprocal(precision, out=precision)
+    w = r * r
+    w *= precision
+    return w
+
+
 def _weighted_mean(values: np.ndarray, weights: np.ndarray) -> float:
     """Compute weighted mean with basic validation; returns NaN if no valid data."""
     if values.size == 0 or weights.size == 0:
         return float('nan')
-    sum_w = float(np.sum(weights))
-    if sum_w <= 0 or not np.isfinite(sum_w):
+    if _get_moments_kernel() is not None and values.dtype == _float64 and weights.dtype == _float64:
+        # One compiled pass instead of separate sum and dot dispatches
+        return _weighted_moments(values, weights)[1]
+    sum_w = float(weights.sum(dtype=np.float64))
+    if sum_w <= 0 or not math.isfinite(sum_w):
         return float('nan')
-    return float(np.sum(weights * values) / sum_w)
+    return _wdot(weights, values) / sum_w
 
 
 def _weighted_mean_se(values: np.ndarray, weights: np.ndarray) -> float:
@@ -48,116 +207,327 @@ def _weighted_mean_se(values: np.ndarray, weights: np.ndarray) -> float:
     """
     if values.size == 0 or weights.size == 0:
         return float('nan')
-    valid_mask = (np.isfinite(values) & np.isfinite(weights) & (weights > 0))
-    if not np.any(valid_mask):
+    if _get_moments_kernel() is not None and values.dtype == np.float64 and weights.dtype == np.float64:
+        # The compiled kernel skips invalid entries itself
+        v, w = values, weights
+    else:
+        valid_mask = _valid_mask(weights, values, weights)
+        if not np.any(valid_mask):
+            return float('nan')
+        if valid_mask.all():
+            v, w = values, weights
+        else:
+            v = values[valid_mask]
+            w = weights[valid_mask]
+    sum_w, _mean, var_pop, sum_w_sq = _weighted_moments(v, w)
+    if sum_w <= 0 or not math.isfinite(sum_w):
         return float('nan')
-    v = values[valid_mask]
-    w = weights[valid_mask]
-    sum_w = float(np.sum(w))
-    if sum_w <= 0 or not np.isfinite(sum_w):
-        return float('nan')
-    mean = float(np.sum(w * v) / sum_w)
-    dev = v - mean
-    var_pop = float(np.sum(w * (dev ** 2)) / sum_w)
-    sum_w_sq = float(np.sum(w ** 2))
+    return _se_from_moments(sum_w, var_pop, sum_w_sq)
+
+
+def _se_from_moments(sum_w: float, var_pop: float, sum_w_sq: float) -> float:
+    """SE(mean) from (Σw, var_pop, Σw²); see _weighted_mean_se for the steps."""
     if sum_w_sq <= 0:
         return float('nan')
-    n_eff = (sum_w ** 2) / sum_w_sq
+    n_eff = (sum_w * sum_w) / sum_w_sq
     if n_eff <= 0:
         return float('nan')
-    var_sample = var_pop * (n_eff / (n_eff - 1.0)) if n_eff > 1 else var_pop
-    se = float(np.sqrt(var_sample / n_eff))
-    return se
+    # var_sample / n_eff with var_sample = var_pop × N_eff/(N_eff - 1) is just
+    # var_pop / (N_eff - 1); a single effective sample keeps var_pop / N_eff
+    denom = n_eff - 1.0 if n_eff > 1 else n_eff
+    return math.sqrt(var_pop / denom)
+
+
+def _mean_and_se(values: np.ndarray, weights: np.ndarray) -> Tuple[float, float]:
+    """Weighted mean and its SE from a single moments pass over prepared inputs."""
+    if values.size == 0:
+        return float('nan'), float('nan')
+    sum_w, mean, var_pop, sum_w_sq = _weighted_moments(values, weights)
+    if sum_w <= 0 or not math.isfinite(sum_w):
+        return float('nan'), float('nan')
+    return mean, _se_from_moments(sum_w, var_pop, sum_w_sq)
+
+
+@dataclass(frozen=True)
+class WeightedInputs:
+    """
+    Validated values and cluster weights w = (rlapccc)^2 / sigma_z^2.
+
+    Build once with ``from_raw`` and pass to both the mean and SE estimators
+    to avoid re-masking and re-weighting the same match set.
+    """
+    values: np.ndarray
+    weights: np.ndarray
+
+    @classmethod
+    def from_raw(
+        cls,
+        values: Union[np.ndarray, List[float]],
+        redshift_errors: Union[np.ndarray, List[float]],
+        rlap_ccc_values: Union[np.ndarray, List[float]],
+        *,
+        dtype: np.dtype = np.float64
+    ) -> "WeightedInputs":
+        """Drop non-finite entries and sigma_z <= 0, then compute cluster weights.
+
+        With ``dtype=np.float32`` the stored arrays are single precision (sums
+        are still accumulated in float64); weights are rescaled to a maximum
+        of 1, which leaves the weighted mean and its SE unchanged but keeps
+        Σw² within float32 range.
+
+        Raises ValueError if the input lengths differ.
+        """
+        x = _as_float(values)
+        sigma = _as_float(redshift_errors)
+        r = _as_float(rlap_ccc_values)
+        if not (len(x) == len(sigma) == len(r)):
+            raise ValueError("Values, redshift errors and metric values must have same length")
+        return cls._from_mask(x, sigma, r, _valid_mask(sigma, x, sigma, r), dtype=dtype)
+
+    @classmethod
+    def _from_mask(
+        cls,
+        x: np.ndarray,
+        sigma: np.ndarray,
+        r: np.ndarray,
+        valid: np.ndarray,
+        *,
+        dtype: np.dtype = np.float64
+    ) -> "WeightedInputs":
+        """Build from float arrays and an already computed validity mask."""
+        if valid.all():
+            # Usual case: nothing to drop, so skip the boolean-indexed copies
+            values = x
+            weights = _weights_from_valid(r, sigma)
+        elif valid.any():
+            values = x[valid]
+            weights = _weights_from_valid(r[valid], sigma[valid])
+        else:
+            empty = np.empty(0, dtype=dtype)
+            return cls(empty, empty)
+        if np.dtype(dtype) == np.float64:
+            return cls(values.astype(np.float64, copy=False), weights.astype(np.float64, copy=False))
+        w_max = float(weights.max())
+        if w_max > 0 and math.isfinite(w_max):
+            weights = weights / w_max
+        return cls(values.astype(dtype), weights.astype(dtype))
+
+    def mean(self) -> float:
+        """Weighted mean only (NaN if no data); skips the SE moments."""
+        return _weighted_mean(self.values, self.weights)
+
+    def mean_and_se(self) -> Tuple[float, float]:
+        """Weighted mean and its SE from a single moments pass (NaN if no data)."""
+        return _mean_and_se(self.values, self.weights)
+
+
+def _coerce_inputs(
+    values: Union["WeightedInputs", np.ndarray, List[float]],
+    redshift_errors: Optional[Union[np.ndarray, List[float]]],
+    rlap_ccc_values: Optional[Union[np.ndarray, List[float]]],
+    caller: str,
+    dtype: np.dtype = np.float64
+) -> Optional[WeightedInputs]:
+    """Return ``values`` if already prepared, else build WeightedInputs (None on bad input)."""
+    if isinstance(values, WeightedInputs):
+        return values
+    if redshift_errors is None or rlap_ccc_values is None:
+        logger.error(f"Missing redshift errors or metric values for {caller}")
+        return None
+    try:
+        return WeightedInputs.from_raw(values, redshift_errors, rlap_ccc_values, dtype=dtype)
+    except ValueError:
+        logger.error(f"Mismatched input lengths for {caller}")
+        return None
+
+
+def _weighted_stat(
+    aggregate: Callable[[np.ndarray, np.ndarray], float],
+    values: Union["WeightedInputs", np.ndarray, List[float]],
+    redshift_errors: Optional[Union[np.ndarray, List[float]]],
+    rlap_ccc_values: Optional[Union[np.ndarray, List[float]]],
+    caller: str,
+    dtype: np.dtype
+) -> float:
+    """Shared body of the four public estimators: coerce inputs, then aggregate (NaN if no data)."""
+    inputs = _coerce_inputs(values, redshift_errors, rlap_ccc_values, caller, dtype)
+    if inputs is None or inputs.values.size == 0:
+        return float('nan')
+    return aggregate(inputs.values, inputs.weights)
 
 
 def estimate_weighted_redshift(
-    redshifts: Union[np.ndarray, List[float]],
-    redshift_errors: Union[np.ndarray, List[float]],
-    rlap_ccc_values: Union[np.ndarray, List[float]]
+    redshifts: Union[WeightedInputs, np.ndarray, List[float]],
+    redshift_errors: Optional[Union[np.ndarray, List[float]]] = None,
+    rlap_ccc_values: Optional[Union[np.ndarray, List[float]]] = None,
+    *,
+    dtype: np.dtype = np.float64
 ) -> float:
     """
     Weighted mean redshift using weights w = (rlapccc)^2 / sigma_z^2.
+
+    Accepts raw arrays or a prepared ``WeightedInputs``; ``dtype`` selects the
+    working precision for raw arrays (see ``WeightedInputs.from_raw``).
     """
-    z = np.asarray(redshifts, dtype=float)
-    sigma = np.asarray(redshift_errors, dtype=float)
-    r = np.asarray(rlap_ccc_values, dtype=float)
-    if not (len(z) == len(sigma) == len(r)):
-        logger.error("Mismatched input lengths for estimate_weighted_redshift")
-        return float('nan')
-    valid = (np.isfinite(z) & np.isfinite(sigma) & np.isfinite(r) & (sigma > 0))
-    if not np.any(valid):
-        return float('nan')
-    w = compute_cluster_weights(r[valid], sigma[valid])
-    return _weighted_mean(z[valid], w)
+    return _weighted_stat(_weighted_mean, redshifts, redshift_errors, rlap_ccc_values, "estimate_weighted_redshift", dtype)
 
 
 def estimate_weighted_epoch(
-    ages: Union[np.ndarray, List[float]],
-    redshift_errors: Union[np.ndarray, List[float]],
-    rlap_ccc_values: Union[np.ndarray, List[float]]
+    ages: Union[WeightedInputs, np.ndarray, List[float]],
+    redshift_errors: Optional[Union[np.ndarray, List[float]]] = None,
+    rlap_ccc_values: Optional[Union[np.ndarray, List[float]]] = None,
+    *,
+    dtype: np.dtype = np.float64
 ) -> float:
     """
     Weighted mean epoch (age) using the same cluster weights as redshift:
     w = (rlapccc)^2 / sigma_z^2.
+
+    Accepts raw arrays or a prepared ``WeightedInputs``; ``dtype`` selects the
+    working precision for raw arrays (see ``WeightedInputs.from_raw``).
     """
-    t = np.asarray(ages, dtype=float)
-    sigma = np.asarray(redshift_errors, dtype=float)
-    r = np.asarray(rlap_ccc_values, dtype=float)
-    if not (len(t) == len(sigma) == len(r)):
-        logger.error("Mismatched input lengths for estimate_weighted_epoch")
-        return float('nan')
-    valid = (np.isfinite(t) & np.isfinite(sigma) & np.isfinite(r) & (sigma > 0))
-    if not np.any(valid):
-        return float('nan')
-    w = compute_cluster_weights(r[valid], sigma[valid])
-    return _weighted_mean(t[valid], w)
+    return _weighted_stat(_weighted_mean, ages, redshift_errors, rlap_ccc_values, "estimate_weighted_epoch", dtype)
 
 
 def weighted_redshift_se(
-    redshifts: Union[np.ndarray, List[float]],
-    redshift_errors: Union[np.ndarray, List[float]],
-    rlap_ccc_values: Union[np.ndarray, List[float]]
+    redshifts: Union[WeightedInputs, np.ndarray, List[float]],
+    redshift_errors: Optional[Union[np.ndarray, List[float]]] = None,
+    rlap_ccc_values: Optional[Union[np.ndarray, List[float]]] = None,
+    *,
+    dtype: np.dtype = np.float64
 ) -> float:
     """
     Standard error (SE) of the weighted mean redshift using w = (rlapccc)^2 / sigma_z^2.
     Previously returned sample SD; now returns SE(mean) for stability and interpretability.
     """
-    z = np.asarray(redshifts, dtype=float)
-    sigma = np.asarray(redshift_errors, dtype=float)
-    r = np.asarray(rlap_ccc_values, dtype=float)
-    if not (len(z) == len(sigma) == len(r)):
-        logger.error("Mismatched input lengths for weighted_redshift_se")
-        return float('nan')
-    valid = (np.isfinite(z) & np.isfinite(sigma) & np.isfinite(r) & (sigma > 0))
-    if not np.any(valid):
-        return float('nan')
-    w = compute_cluster_weights(r[valid], sigma[valid])
-    return _weighted_mean_se(z[valid], w)
+    return _weighted_stat(_weighted_mean_se, redshifts, redshift_errors, rlap_ccc_values, "weighted_redshift_se", dtype)
 
 
 def weighted_epoch_se(
-    ages: Union[np.ndarray, List[float]],
-    redshift_errors: Union[np.ndarray, List[float]],
-    rlap_ccc_values: Union[np.ndarray, List[float]]
+    ages: Union[WeightedInputs, np.ndarray, List[float]],
+    redshift_errors: Optional[Union[np.ndarray, List[float]]] = None,
+    rlap_ccc_values: Optional[Union[np.ndarray, List[float]]] = None,
+    *,
+    dtype: np.dtype = np.float64
 ) -> float:
     """
     Standard error (SE) of the weighted mean age using w = (rlapccc)^2 / sigma_z^2.
     Previously returned sample SD; now returns SE(mean).
     """
-    t = np.asarray(ages, dtype=float)
-    sigma = np.asarray(redshift_errors, dtype=float)
-    r = np.asarray(rlap_ccc_values, dtype=float)
-    if not (len(t) == len(sigma) == len(r)):
-        logger.error("Mismatched input lengths for weighted_epoch_se")
-        return float('nan')
-    valid = (np.isfinite(t) & np.isfinite(sigma) & np.isfinite(r) & (sigma > 0))
-    if not np.any(valid):
-        return float('nan')
-    w = compute_cluster_weights(r[valid], sigma[valid])
-    return _weighted_mean_se(t[valid], w)
+    return _weighted_stat(_weighted_mean_se, ages, redshift_errors, rlap_ccc_values, "weighted_epoch_se", dtype)
+
+
+class WeightedSummary(NamedTuple):
+    """Weighted means and their standard errors for redshift and epoch."""
+    z_mean: float
+    z_se: float
+    t_mean: float
+    t_se: float
+
+
+def weighted_summary(
+    redshifts: Union[np.ndarray, List[float]],
+    ages: Union[np.ndarray, List[float]],
+    redshift_errors: Union[np.ndarray, List[float]],
+    rlap_ccc_values: Union[np.ndarray, List[float]]
+) -> WeightedSummary:
+    """
+    Weighted mean and SE of both redshift and epoch in one call.
+
+    Matches the four individual estimators called with the same redshift
+    errors and metric values, but the sigma/metric validity mask is built
+    once, each mean/SE pair comes from one moments pass, and the weights
+    are shared when redshift and age are valid on the same rows.
+    """
+    nan = float('nan')
+    z = _as_float(redshifts)
+    t = _as_float(ages)
+    sigma = _as_float(redshift_errors)
+    r = _as_float(rlap_ccc_values)
+    if not (len(z) == len(t) == len(sigma) == len(r)):
+        logger.error("Mismatched input lengths for weighted_summary")
+        return WeightedSummary(nan, nan, nan, nan)
+    base = _valid_mask(sigma, sigma, r)
+    z_valid = base & np.isfinite(z)
+    t_valid = base & np.isfinite(t)
+    z_inputs = WeightedInputs._from_mask(z, sigma, r, z_valid)
+    if np.array_equal(z_valid, t_valid):
+        t_inputs = WeightedInputs(t[t_valid], z_inputs.weights)
+    else:
+        t_inputs = WeightedInputs._from_mask(t, sigma, r, t_valid)
+    z_mean, z_se = _mean_and_se(z_inputs.values, z_inputs.weights)
+    t_mean, t_se = _mean_and_se(t_inputs.values, t_inputs.weights)
+    return WeightedSummary(z_mean, z_se, t_mean, t_se)
+
+
+def weighted_summary_batch(
+    values: Union[np.ndarray, List[float]],
+    redshift_errors: Union[np.ndarray, List[float]],
+    rlap_ccc_values: Union[np.ndarray, List[float]],
+    offsets: Optional[Union[np.ndarray, List[int]]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Weighted means and SEs for many clusters at once.
+
+    Clusters are stored back to back (CSR layout): cluster ``k`` covers
+    ``values[offsets[k]:offsets[k + 1]]``. Per cluster the result equals
+    ``WeightedInputs.from_raw(...).mean_and_se()`` on that slice, but all
+    clusters are reduced with segmented NumPy sums instead of a Python loop.
+    Without ``offsets`` the inputs are (K, N) arrays with one cluster per
+    row; pad short clusters with NaN.
+
+    Returns (means, ses), each of length ``len(offsets) - 1`` (or K); NaN
+    for clusters without valid data.
+    """
+    x = _as_float(values)
+    sigma = _as_float(redshift_errors)
+    r = _as_float(rlap_ccc_values)
+    if offsets is None:
+        if x.ndim != 2 or x.shape != sigma.shape or x.shape != r.shape:
+            raise ValueError("Without offsets, inputs must be (n_clusters, n) arrays of the same shape")
+        offs = np.arange(x.shape[0] + 1, dtype=np.intp) * x.shape[1]
+        x, sigma, r = x.ravel(), sigma.ravel(), r.ravel()
+    else:
+        offs = np.asarray(offsets, dtype=np.intp)
+    if not (len(x) == len(sigma) == len(r)):
+        raise ValueError("Values, redshift errors and metric values must have same length")
+    if offs.ndim != 1 or offs.size < 1 or offs[0] != 0 or offs[-1] != len(x) or np.any(np.diff(offs) < 0):
+        raise ValueError("offsets must be non-decreasing, start at 0 and end at len(values)")
+    n_clusters = offs.size - 1
+    means = np.full(n_clusters, np.nan)
+    ses = np.full(n_clusters, np.nan)
+    if n_clusters == 0 or x.size == 0:
+        return means, ses
+
+    # Invalid rows get zero weight (and a zero value so 0 * NaN cannot leak in)
+    valid = _valid_mask(sigma, x, sigma, r)
+    w = np.zeros(x.shape)  # float64 so segment sums accumulate in double precision
+    w[valid] = _weights_from_valid(r[valid], sigma[valid])
+    xv = np.where(valid, x, 0.0)
+
+    lengths = np.diff(offs)
+    nonempty = lengths > 0
+    # reduceat misreads empty segments, so reduce over the non-empty starts only
+    starts = offs[:-1][nonempty]
+
+    def seg_sum(a: np.ndarray) -> np.ndarray:
+        out = np.zeros(n_clusters)
+        out[nonempty] = np.add.reduceat(a, starts)
+        return out
+
+    sum_w = seg_sum(w)
+    sum_w_sq = seg_sum(w * w)
+    ok = (sum_w > 0) & np.isfinite(sum_w) & (sum_w_sq > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = seg_sum(w * xv) / sum_w
+        dev = xv - np.repeat(mean, lengths)
+        var_pop = seg_sum(w * dev * dev) / sum_w
+        n_eff = sum_w * sum_w / sum_w_sq
+        se = np.sqrt(var_pop / np.where(n_eff > 1, n_eff - 1.0, n_eff))
+    means[ok] = mean[ok]
+    ses[ok] = se[ok]
+    return means, ses
 
-# Backward-compatible aliases (deprecated):
-# Removed deprecated aliases weighted_redshift_sd/weighted_epoch_sd
 
 def calculate_combined_weights(
     rlap_ccc_values: Union[np.ndarray, List[float]],
@@ -201,20 +571,41 @@ def calculate_combined_weights(
     if len(rlap_ccc_values) == 0:
         return np.array([])
     
-    # Handle zero uncertainties (perfect measurements) by using a small floor value
-    # This prevents infinite weights while preserving the relative ordering
-    min_uncertainty = np.min(uncertainties[uncertainties > 0]) if np.any(uncertainties > 0) else 1e-6
-    uncertainty_floor = min_uncertainty * 0.1
-    safe_uncertainties = np.maximum(uncertainties, uncertainty_floor)
-    
-    # Calculate combined weights using squared best-metric values (RLAP-CCC preferred)
-    quality_weights = rlap_ccc_values ** 2
-    precision_weights = 1.0 / (safe_uncertainties ** 2)  # Inverse variance weighting
-    combined_weights = quality_weights * precision_weights
+    positive = uncertainties > 0
+    if positive.all():
+        # No zero/invalid uncertainties, so the 0.1 × min floor below cannot
+        # bind; skip the floor scan and its padded copy
+        combined_weights = _weights_from_valid(rlap_ccc_values, uncertainties)
+    else:
+        # Handle zero uncertainties (perfect measurements) by using a small floor value
+        # This prevents infinite weights while preserving the relative ordering
+        # Smallest positive uncertainty in one fused pass (non-positive/NaN entries map to inf);
+        # the positivity mask is reused for the all-invalid check
+        min_uncertainty = np.where(positive, uncertainties, np.inf).min()
+        if min_uncertainty == np.inf and not positive.any():
+            min_uncertainty = 1e-6
+        uncertainty_floor = min_uncertainty * 0.1
+        safe_uncertainties = np.maximum(uncertainties, uncertainty_floor)
+        
+        # Calculate combined weights using squared best-metric values (RLAP-CCC preferred)
+        # times inverse variance
+        weights_ufunc = _get_weights_ufunc()
+        if weights_ufunc is not None:
+            combined_weights = weights_ufunc(rlap_ccc_values, safe_uncertainties)
+        else:
+            # safe_uncertainties is a fresh array, so square and invert it in place
+            precision_weights = safe_uncertainties
+            precision_weights *= precision_weights
+            np.reciprocal(precision_weights, out=precision_weights)  # Inverse variance weighting
+            combined_weights = rlap_ccc_values * rlap_ccc_values
+            combined_weights *= precision_weights
     
-    logger.debug(f"Combined weighting: Best-metric [{rlap_ccc_values.min():.2f}, {rlap_ccc_values.max():.2f}], "
-                f"uncertainties [{uncertainties.min():.4f}, {uncertainties.max():.4f}], "
-                f"weights [{combined_weights.min():.2e}, {combined_weights.max():.2e}]")
+    # Range reductions only run when DEBUG is actually enabled (called per estimate)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Combined weighting: Best-metric [%.2f, %.2f], uncertainties [%.4f, %.4f], weights [%.2e, %.2e]",
+                     rlap_ccc_values.min(), rlap_ccc_values.max(),
+                     uncertainties.min(), uncertainties.max(),
+                     combined_weights.min(), combined_weights.max())
     
     return combined_weights
 
@@ -247,12 +638,13 @@ def apply_exponential_weighting(rlap_ccc_values: Union[np.ndarray, List[float]])
         return np.array([])
     
     # Apply squared weighting: w = x^2
-    exponential_weights = rlap_ccc_values ** 2
+    exponential_weights = np.multiply(rlap_ccc_values, rlap_ccc_values)
     
     # Log the transformation for debugging
-    if len(rlap_ccc_values) > 0:
-        logger.debug(f"Squared weighting: Best-metric range [{rlap_ccc_values.min():.2f}, {rlap_ccc_values.max():.2f}] "
-                    f"→ weight range [{exponential_weights.min():.2e}, {exponential_weights.max():.2e}]")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Squared weighting: Best-metric range [%.2f, %.2f] → weight range [%.2e, %.2e]",
+                     rlap_ccc_values.min(), rlap_ccc_values.max(),
+                     exponential_weights.min(), exponential_weights.max())
     
     return exponential_weights
 
@@ -261,11 +653,15 @@ def apply_exponential_weighting(rlap_ccc_values: Union[np.ndarray, List[float]])
 
 # Exports
 __all__ = [
+    'WeightedInputs',
     'calculate_combined_weights',
     'apply_exponential_weighting',
     'compute_cluster_weights',
     'estimate_weighted_redshift',
     'estimate_weighted_epoch',
     'weighted_redshift_se',
-    'weighted_epoch_se'
+    'weighted_epoch_se',
+    'WeightedSummary',
+    'weighted_summary',
+    'weighted_summary_batch'
 ]
\ No newline at end of file
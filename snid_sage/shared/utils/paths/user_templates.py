@@ -10,15 +10,50 @@ User Templates Path Resolver
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import copy
+import functools
 import os
+import stat
 
 try:
     from importlib import resources
 except Exception:  # pragma: no cover
     resources = None  # type: ignore
 
-from snid_sage.shared.utils.config.configuration_manager import ConfigurationManager
+if TYPE_CHECKING:  # pragma: no cover
+    from snid_sage.shared.utils.config.configuration_manager import ConfigurationManager
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cm() -> ConfigurationManager:
+    """Private ConfigurationManager reused by the resolvers (kept apart from the
+    shared ``config_manager`` so loading here never replaces its in-memory state).
+
+    Imported on first use so importing this module stays cheap.
+    """
+    from snid_sage.shared.utils.config.configuration_manager import ConfigurationManager
+
+    return ConfigurationManager()
+
+
+# Parsed configuration, reused while the config file's mtime is unchanged
+_config_cache: Dict[str, Any] = {'mtime': None, 'cfg': None}
+
+
+def _get_config() -> Dict[str, Any]:
+    """Return the current configuration, re-reading the file only when it changed on disk."""
+    try:
+        mtime = _get_cm().default_config_file.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is not None and mtime == _config_cache['mtime'] and _config_cache['cfg'] is not None:
+        return _config_cache['cfg']
+    cfg = _get_cm().load_config()
+    # Only cache a config backed by a file; defaults/migration are re-resolved each time
+    _config_cache['mtime'] = mtime
+    _config_cache['cfg'] = cfg if mtime is not None else None
+    return cfg
 
 
 def _is_writable_dir(path: Path) -> bool:
@@ -29,6 +64,21 @@ def _is_writable_dir(path: Path) -> bool:
         return False
 
 
+def _looks_like_user_library(path: Path) -> bool:
+    """True if ``path`` holds a user index or per-type user HDF5 file (one directory scan)."""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == 'template_index.user.json':
+                    return True
+                if name.startswith('templates_') and name.endswith('.user.hdf5'):
+                    return True
+    except OSError:
+        return False
+    return False
+
+
 def get_user_templates_dir(strict: bool = False) -> Optional[Path]:
     """
     Return the configured user templates directory, or None if unset/invalid.
@@ -37,8 +87,7 @@ def get_user_templates_dir(strict: bool = False) -> Optional[Path]:
     - strict=False: same behavior for now (no implicit fallbacks). Legacy discovery should
       be explicitly requested by callers via discover_legacy_user_templates().
     """
-    cm = ConfigurationManager()
-    cfg = cm.get_current_config() or cm.load_config()
+    cfg = _get_config()
     paths = (cfg.get('paths') or {})
     override = paths.get('user_templates_dir')
     if override:
@@ -54,78 +103,127 @@ def set_user_templates_dir(path: Path) -> None:
     if not _is_writable_dir(path):
         raise PermissionError(f"User templates directory is not writable: {path}")
 
-    cm = ConfigurationManager()
-    cfg = cm.get_current_config() or cm.load_config()
+    # Copy so a failed save cannot leave the cached config modified
+    cfg = copy.deepcopy(_get_config())
     cfg.setdefault('paths', {})['user_templates_dir'] = str(path)
-    cm.save_config(cfg)
+    try:
+        _get_cm().save_config(cfg)
+    finally:
+        _config_cache['mtime'] = None
+        _config_cache['cfg'] = None
 
 
-def discover_legacy_user_templates() -> List[Path]:
-    """
-    Discover previous fallback locations that may contain an existing user library.
+@functools.lru_cache(maxsize=1)
+def _builtin_user_templates_dir() -> Optional[Path]:
+    """Legacy location next to the built-in templates (snid_sage/templates/User_templates).
 
-    This does NOT create directories; it only returns existing, writable candidates
-    that contain hints of a user library (index or per-type user HDF5 files).
+    The package location does not move while the process runs, so the
+    importlib.resources lookup is done once.
     """
-    candidates: List[Path] = []
+    if resources is None:
+        return None
+    try:
+        with resources.as_file(resources.files('snid_sage') / 'templates') as tpl_dir:
+            return Path(tpl_dir) / 'User_templates'
+    except Exception:
+        return None
 
-    # 0) If config already points to a dir that exists/writable, prefer it
-    current = get_user_templates_dir(strict=False)
-    if current and current.exists() and _is_writable_dir(current):
-        candidates.append(current)
+
+def _legacy_candidate_dirs() -> List[Path]:
+    """Fixed fallback locations probed by discovery, in preference order."""
+    dirs: List[Path] = []
 
     # 1) Sibling to built-ins (snid_sage/templates/User_templates)
+    builtin = _builtin_user_templates_dir()
+    if builtin is not None:
+        dirs.append(builtin)
+
+    # Home resolved once for steps 2 and 4
     try:
-        if resources is not None:
-            with resources.as_file(resources.files('snid_sage') / 'templates') as tpl_dir:
-                p = (tpl_dir / 'User_templates')
-                if p.exists() and _is_writable_dir(p):
-                    candidates.append(p)
+        home: Optional[Path] = Path.home()
     except Exception:
-        pass
+        home = None
 
     # 2) Documents/SNID_SAGE/User_templates
-    try:
-        docs = Path.home() / 'Documents' / 'SNID_SAGE' / 'User_templates'
-        if docs.exists() and _is_writable_dir(docs):
-            candidates.append(docs)
-    except Exception:
-        pass
+    if home is not None:
+        dirs.append(home / 'Documents' / 'SNID_SAGE' / 'User_templates')
 
     # 3) App config dir templates/User_templates
     try:
-        cm = ConfigurationManager()
-        appdata = Path(cm.config_dir) / 'templates' / 'User_templates'
-        if appdata.exists() and _is_writable_dir(appdata):
-            candidates.append(appdata)
+        dirs.append(Path(_get_cm().config_dir) / 'templates' / 'User_templates')
     except Exception:
         pass
 
     # 4) Home fallback ~/.snid_sage/User_templates
+    if home is not None:
+        dirs.append(home / '.snid_sage' / 'User_templates')
+    return dirs
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
     try:
-        home_fb = Path.home() / '.snid_sage' / 'User_templates'
-        if home_fb.exists() and _is_writable_dir(home_fb):
-            candidates.append(home_fb)
-    except Exception:
-        pass
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+# Last discovery result, keyed on the configured directory plus the mtimes of
+# every candidate and its parent (creating/removing a candidate or a library
+# file inside one changes them)
+_discovery_cache: Dict[str, Any] = {'key': None, 'val': None}
+
+
+def discover_legacy_user_templates() -> List[Path]:
+    """
+    Discover previous fallback locations that may contain an existing user library.
+
+    This does NOT create directories; it only returns existing, writable candidates
+    that contain hints of a user library (index or per-type user HDF5 files).
+    If the configured directory is already populated it is returned alone and
+    the fallback locations are not probed. Results are reused until one of the
+    probed directories changes.
+    """
+    # 0) If config already points to a dir that exists/writable, prefer it
+    #    (get_user_templates_dir only returns validated, writable paths)
+    current = get_user_templates_dir(strict=False)
+    if current and _looks_like_user_library(current):
+        return [current]
+
+    # One stat per candidate (and parent) serves both the cache key and the
+    # is-directory check below
+    fallbacks = _legacy_candidate_dirs()
+    watched = ([current] if current else []) + fallbacks
+    stats = [(_stat_or_none(p), _stat_or_none(p.parent)) for p in watched]
+    key = (
+        str(current) if current else None,
+        tuple(
+            (st.st_mtime_ns if st else None, pst.st_mtime_ns if pst else None)
+            for st, pst in stats
+        ),
+    )
+    if key == _discovery_cache['key']:
+        return list(_discovery_cache['val'])
+
+    candidates: List[Path] = [current] if current else []
+    for p, (st, _) in zip(watched[len(candidates):], stats[len(candidates):]):
+        if st is not None and stat.S_ISDIR(st.st_mode) and os.access(p, os.W_OK):
+            candidates.append(p)
 
     # Filter for libraries that look populated
     filtered: List[Path] = []
     seen = set()
     for p in candidates:
-        key = str(p.resolve())
-        if key in seen:
-            continue
-        seen.add(key)
-        try:
-            has_index = (p / 'template_index.user.json').exists()
-            has_h5 = any(p.glob('templates_*.user.hdf5'))
-            if has_index or has_h5:
-                filtered.append(p)
-        except Exception:
+        # Lexical normalisation; avoids a resolve() syscall chain per candidate
+        key_path = os.path.normcase(os.path.normpath(os.fspath(p)))
+        if key_path in seen:
             continue
+        seen.add(key_path)
+        if _looks_like_user_library(p):
+            filtered.append(p)
 
-    return filtered
+    _discovery_cache['key'] = key
+    _discovery_cache['val'] = filtered
+    return list(filtered)
 
 
 __all__ = [
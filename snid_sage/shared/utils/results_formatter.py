@@ -250,10 +250,9 @@ class UnifiedResultsFormatter:
                             weights = calculate_combined_weights(np.array(rlap_values, dtype=float), np.array(z_errors, dtype=float))
                             # Use canonical weights for age via redshift errors if available (fallback to quality-only)
                             try:
-                                from snid_sage.shared.utils.math_utils import estimate_weighted_epoch, weighted_epoch_se
+                                from snid_sage.shared.utils.math_utils import WeightedInputs
                                 # If we don't have redshift errors aligned, keep previous behavior minimally
-                                age_mean = estimate_weighted_epoch(ages, [1.0]*len(ages), rlap_values)
-                                age_total_error = weighted_epoch_se(ages, [1.0]*len(ages), rlap_values)
+                                age_mean, age_total_error = WeightedInputs.from_raw(ages, [1.0]*len(ages), rlap_values).mean_and_se()
                             except Exception:
                                 age_mean = float(np.mean(ages)) if len(ages) else float('nan')
                                 age_total_error = float('nan')
@@ -261,9 +260,8 @@ class UnifiedResultsFormatter:
                             # Fallback to quality-only if no valid z errors
                             from snid_sage.shared.utils.math_utils import apply_exponential_weighting
                             try:
-                                from snid_sage.shared.utils.math_utils import estimate_weighted_epoch, weighted_epoch_se
-                                age_mean = estimate_weighted_epoch(ages, [1.0]*len(ages), rlap_values)
-                                age_total_error = weighted_epoch_se(ages, [1.0]*len(ages), rlap_values)
+                                from snid_sage.shared.utils.math_utils import WeightedInputs
+                                age_mean, age_total_error = WeightedInputs.from_raw(ages, [1.0]*len(ages), rlap_values).mean_and_se()
                             except Exception:
                                 age_mean = float(np.mean(ages)) if len(ages) else float('nan')
                                 age_total_error = float('nan')
@@ -602,8 +600,12 @@ class UnifiedResultsFormatter:
                 if w_sum <= 0:
                     w = np.ones_like(arr)
                     w_sum = np.sum(w)
-                mean = float(np.sum(w * arr) / w_sum)
-                var = float(np.sum(w * (arr - mean) ** 2) / w_sum) if arr.size > 1 else None
+                mean = float(np.dot(w, arr) / w_sum)
+                if arr.size > 1:
+                    dev = arr - mean
+                    var = float(np.einsum('i,i,i->', w, dev, dev) / w_sum)
+                else:
+                    var = None
                 sd = float(np.sqrt(var)) if var is not None else None
                 return mean, sd
             except Exception:
@@ -636,9 +638,13 @@ class UnifiedResultsFormatter:
                 if w_sum <= 0:
                     w = np.ones_like(vals)
                     w_sum = np.sum(w)
-                mean = float(np.sum(w * vals) / w_sum)
-                between_var = float(np.sum(w * (vals - mean) ** 2) / w_sum) if vals.size > 1 else 0.0
-                meas_var = float(np.sum(w * (sigmas_arr ** 2)) / w_sum) if np.any(sigmas_arr > 0) else 0.0
+                mean = float(np.dot(w, vals) / w_sum)
+                if vals.size > 1:
+                    dev = vals - mean
+                    between_var = float(np.einsum('i,i,i->', w, dev, dev) / w_sum)
+                else:
+                    between_var = 0.0
+                meas_var = float(np.einsum('i,i,i->', w, sigmas_arr, sigmas_arr) / w_sum) if np.any(sigmas_arr > 0) else 0.0
                 sd = float(np.sqrt(max(between_var + meas_var, 0.0))) if vals.size > 1 or meas_var > 0 else None
                 return mean, sd
             except Exception:
@@ -668,20 +674,13 @@ class UnifiedResultsFormatter:
         # Prepare rows
         subtype_rows = []
         # Use canonical weighting/statistics from math_utils for consistency
-        from snid_sage.shared.utils.math_utils.weighted_statistics import (
-            estimate_weighted_redshift,
-            weighted_redshift_se,
-            estimate_weighted_epoch,
-            weighted_epoch_se,
-        )
+        from snid_sage.shared.utils.math_utils.weighted_statistics import weighted_summary
 
         for st, agg in subtypes.items():
-            # Weighted mean and SE for redshift
-            z_mean = estimate_weighted_redshift(agg['z_vals'], agg['z_errs'], agg['metrics'])
-            z_se = weighted_redshift_se(agg['z_vals'], agg['z_errs'], agg['metrics'])
-            # Weighted mean and SE for age using same redshift-error weights
-            age_mean = estimate_weighted_epoch(agg['age_vals'], agg['z_errs'], agg['metrics'])
-            age_se = weighted_epoch_se(agg['age_vals'], agg['z_errs'], agg['metrics'])
+            # Weighted mean and SE for redshift and for age (same redshift-error weights)
+            z_mean, z_se, age_mean, age_se = weighted_summary(
+                agg['z_vals'], agg['age_vals'], agg['z_errs'], agg['metrics']
+            )
 
             # Top-5 weighted scoring method (rank score):
             #  - Select top 5 by metric value
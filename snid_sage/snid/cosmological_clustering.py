@@ -16,6 +16,7 @@ The clustering works directly with redshift values using the same approach
 as the transformation_comparison_test.py reference implementation.
 """
 
+import math
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from sklearn.mixture import GaussianMixture
@@ -34,6 +35,46 @@ _LOGGER = logging.getLogger(__name__)
 
 
 
+def _weighted_redshift_age_estimates(
+    matches: List[Dict[str, Any]]
+) -> Tuple[float, float, float, float]:
+    """Weighted redshift/age means and SEs for matches, sharing one set of weights.
+    Returns (z_mean, t_mean, z_se, t_se)."""
+    from snid_sage.shared.utils.math_utils import (
+        get_best_metric_value,
+        weighted_summary,
+    )
+
+    # One row per match; weighted_summary drops rows with a non-finite value
+    # or sigma_z <= 0 separately for redshift and age, and computes the
+    # cluster weights once for both when the valid rows coincide (the usual case)
+    n_rows = len(matches)
+    redshifts = np.empty(n_rows)
+    ages = np.empty(n_rows)
+    redshift_errors = np.empty(n_rows)
+    metric_values = np.empty(n_rows)
+    for i, match in enumerate(matches):
+        z = match.get('redshift')
+        z_err = match.get('redshift_error', 0.0)
+        age = match.get('template', {}).get('age', 0.0)
+        redshifts[i] = z if z is not None else np.nan
+        ages[i] = age if age is not None else np.nan
+        redshift_errors[i] = z_err if z_err is not None else np.nan
+        metric_values[i] = get_best_metric_value(match)
+
+    summary = weighted_summary(redshifts, ages, redshift_errors, metric_values)
+    z_mean, z_se = summary.z_mean, summary.z_se
+    if math.isnan(z_mean):
+        _LOGGER.warning("No valid redshift data found in cluster matches")
+        # Age is only reported alongside a valid redshift estimate
+        t_mean, t_se = np.nan, np.nan
+    else:
+        t_mean, t_se = summary.t_mean, summary.t_se
+        if math.isnan(t_mean):
+            _LOGGER.warning("No valid age data found in cluster matches")
+    return z_mean, t_mean, z_se, t_se
+
+
 def calculate_joint_subtype_estimates_from_cluster(
     cluster_matches: List[Dict[str, Any]], 
     target_subtype: str
@@ -72,7 +113,7 @@ def calculate_joint_subtype_estimates_from_cluster(
             age = template.get('age', 0.0)
             # Only include templates with both redshift and finite age for joint estimation
             # Note: Negative ages are acceptable (pre-maximum light)
-            if 'redshift' in match and np.isfinite(age):
+            if 'redshift' in match and math.isfinite(age):
                 subtype_matches.append(match)
     
     if not subtype_matches:
@@ -80,66 +121,7 @@ def calculate_joint_subtype_estimates_from_cluster(
         return np.nan, np.nan, np.nan, np.nan, np.nan, total_subtype_count, 0
     
     # Use weighted estimators directly for the subtype
-    from snid_sage.shared.utils.math_utils import (
-        get_best_metric_value,
-        estimate_weighted_redshift,
-        estimate_weighted_epoch,
-        weighted_redshift_se,
-        weighted_epoch_se,
-    )
-
-    redshifts_for_estimation = []
-    redshift_errors_for_estimation = []
-    metric_values_for_redshift = []
-    ages_for_estimation = []
-    metric_values_for_age = []
-    age_redshift_errors_for_estimation = []
-
-    for match in subtype_matches:
-        if 'redshift' in match:
-            template = match.get('template', {})
-            age = template.get('age', 0.0)
-            metric_val = get_best_metric_value(match)
-            z = match.get('redshift')
-            z_err = match.get('redshift_error', 0.0)
-            if z is not None and np.isfinite(z) and z_err > 0:
-                redshifts_for_estimation.append(z)
-                redshift_errors_for_estimation.append(z_err)
-                metric_values_for_redshift.append(metric_val)
-            if np.isfinite(age) and z_err > 0:
-                ages_for_estimation.append(age)
-                metric_values_for_age.append(metric_val)
-                age_redshift_errors_for_estimation.append(z_err)
-
-    if redshifts_for_estimation:
-        z_mean = estimate_weighted_redshift(
-            redshifts_for_estimation,
-            redshift_errors_for_estimation,
-            metric_values_for_redshift
-        )
-        z_uncertainty = weighted_redshift_se(
-            redshifts_for_estimation,
-            redshift_errors_for_estimation,
-            metric_values_for_redshift
-        )
-    else:
-        _LOGGER.warning("No valid redshift data found in cluster matches")
-        z_mean, z_uncertainty = np.nan, np.nan
-
-    if ages_for_estimation and redshift_errors_for_estimation:
-        t_mean = estimate_weighted_epoch(
-            ages_for_estimation,
-            age_redshift_errors_for_estimation,
-            metric_values_for_age
-        )
-        t_uncertainty = weighted_epoch_se(
-            ages_for_estimation,
-            age_redshift_errors_for_estimation,
-            metric_values_for_age
-        )
-    else:
-        _LOGGER.warning("No valid age data found in cluster matches")
-        t_mean, t_uncertainty = np.nan, np.nan
+    z_mean, t_mean, z_uncertainty, t_uncertainty = _weighted_redshift_age_estimates(subtype_matches)
 
     zt_covariance = 0.0
     
@@ -153,67 +135,11 @@ def _compute_weighted_cluster_stats(
 ) -> Tuple[float, float, float, float, float]:
     """Compute weighted redshift/age and their SE for a set of matches.
     Returns (z_mean, t_mean, z_se, t_se, zt_covariance)."""
-    from snid_sage.shared.utils.math_utils import (
-        get_best_metric_value,
-        estimate_weighted_redshift,
-        estimate_weighted_epoch,
-        weighted_redshift_se,
-        weighted_epoch_se,
+    # Matches without a redshift entry do not contribute to either estimate
+    z_mean, t_mean, z_se, t_se = _weighted_redshift_age_estimates(
+        [match for match in cluster_matches if 'redshift' in match]
     )
 
-    redshifts_for_estimation = []
-    redshift_errors_for_estimation = []
-    metric_values_for_redshift = []
-    ages_for_estimation = []
-    metric_values_for_age = []
-    age_redshift_errors_for_estimation = []
-
-    for match in cluster_matches:
-        if 'redshift' in match:
-            template = match.get('template', {})
-            age = template.get('age', 0.0)
-            metric_val = get_best_metric_value(match)
-            z = match.get('redshift')
-            z_err = match.get('redshift_error', 0.0)
-            if z is not None and np.isfinite(z) and z_err > 0:
-                redshifts_for_estimation.append(z)
-                redshift_errors_for_estimation.append(z_err)
-                metric_values_for_redshift.append(metric_val)
-            if np.isfinite(age) and z_err > 0:
-                ages_for_estimation.append(age)
-                metric_values_for_age.append(metric_val)
-                age_redshift_errors_for_estimation.append(z_err)
-
-    if redshifts_for_estimation:
-        z_mean = estimate_weighted_redshift(
-            redshifts_for_estimation,
-            redshift_errors_for_estimation,
-            metric_values_for_redshift
-        )
-        z_se = weighted_redshift_se(
-            redshifts_for_estimation,
-            redshift_errors_for_estimation,
-            metric_values_for_redshift
-        )
-    else:
-        _LOGGER.warning("No valid redshift data found in cluster matches")
-        z_mean, z_se = np.nan, np.nan
-
-    if ages_for_estimation and redshift_errors_for_estimation:
-        t_mean = estimate_weighted_epoch(
-            ages_for_estimation,
-            age_redshift_errors_for_estimation,
-            metric_values_for_age
-        )
-        t_se = weighted_epoch_se(
-            ages_for_estimation,
-            age_redshift_errors_for_estimation,
-            metric_values_for_age
-        )
-    else:
-        _LOGGER.warning("No valid age data found in cluster matches")
-        t_mean, t_se = np.nan, np.nan
-
     zt_covariance = 0.0
 
     return z_mean, t_mean, z_se, t_se, zt_covariance
@@ -646,7 +572,7 @@ def _perform_direct_gmm_clustering(
                     logprob = gmm.score_samples(features)
                     # Parameter count for full covariance
                     p = (n_clusters - 1) + n_clusters * d + n_clusters * d * (d + 1) / 2.0
-                    bic = -2.0 * float(np.sum(weights * logprob)) + float(p) * np.log(float(np.sum(weights)))
+                    bic = -2.0 * float(np.dot(weights, logprob)) + float(p) * np.log(float(np.sum(weights)))
                 except TypeError:
                     # Resampling fallback
                     rng = np.random.RandomState(42)
@@ -750,7 +676,12 @@ def _perform_direct_gmm_clustering(
                 cluster_metric_values = metric_values[idx]
                 cluster_matches = [type_matches[i] for i in idx]
 
-                redshift_span = float(np.max(cluster_redshifts) - np.min(cluster_redshifts)) if len(cluster_redshifts) > 0 else 0.0
+                # Reduce min/max once; reused for the span and the reported range
+                if len(cluster_redshifts) > 0:
+                    z_lo, z_hi = float(cluster_redshifts.min()), float(cluster_redshifts.max())
+                else:
+                    z_lo, z_hi = 0.0, 0.0
+                redshift_span = z_hi - z_lo
                 if redshift_span <= quality_threshold:
                     redshift_quality = 'tight'
                 elif redshift_span <= quality_threshold * 2:
@@ -771,14 +702,14 @@ def _perform_direct_gmm_clustering(
                     'mean_metric': float(np.mean(cluster_metric_values)) if len(cluster_metric_values) > 0 else 0.0,
                     'std_metric': float(np.std(cluster_metric_values)) if len(cluster_metric_values) > 1 else 0.0,
                     'metric_key': metric_key,
-                    'weighted_mean_redshift': float(weighted_mean_redshift) if np.isfinite(weighted_mean_redshift) else np.nan,
-                    'weighted_redshift_se': float(weighted_redshift_sd) if np.isfinite(weighted_redshift_sd) else np.nan,
+                    'weighted_mean_redshift': float(weighted_mean_redshift) if math.isfinite(weighted_mean_redshift) else np.nan,
+                    'weighted_redshift_se': float(weighted_redshift_sd) if math.isfinite(weighted_redshift_sd) else np.nan,
                     'redshift_span': redshift_span,
                     'redshift_quality': redshift_quality,
                     'cluster_method': 'direct_gmm_contiguous',
                     'rlap_range': (float(np.min(cluster_rlaps)), float(np.max(cluster_rlaps))) if len(cluster_rlaps) > 0 else (0.0, 0.0),
                     'metric_range': (float(np.min(cluster_metric_values)), float(np.max(cluster_metric_values))) if len(cluster_metric_values) > 0 else (0.0, 0.0),
-                    'redshift_range': (float(np.min(cluster_redshifts)), float(np.max(cluster_redshifts))) if len(cluster_redshifts) > 0 else (0.0, 0.0),
+                    'redshift_range': (z_lo, z_hi),
                     'top_5_values': [],
                     'top_5_mean': 0.0,
                     'penalty_factor': 1.0,
@@ -809,7 +740,8 @@ def _perform_direct_gmm_clustering(
                 cluster_metric_values = metric_values[cluster_mask]
                 cluster_matches = [type_matches[i] for i in cluster_indices]
 
-                redshift_span = np.max(cluster_redshifts) - np.min(cluster_redshifts)
+                z_lo, z_hi = np.min(cluster_redshifts), np.max(cluster_redshifts)
+                redshift_span = z_hi - z_lo
                 if redshift_span <= quality_threshold:
                     redshift_quality = 'tight'
                 elif redshift_span <= quality_threshold * 2:
@@ -837,7 +769,7 @@ def _perform_direct_gmm_clustering(
                     'cluster_method': 'direct_gmm',
                     'rlap_range': (np.min(cluster_rlaps), np.max(cluster_rlaps)),
                     'metric_range': (np.min(cluster_metric_values), np.max(cluster_metric_values)),
-                    'redshift_range': (np.min(cluster_redshifts), np.max(cluster_redshifts)),
+                    'redshift_range': (z_lo, z_hi),
                     'top_5_values': [],
                     'top_5_mean': 0.0,
                     'penalty_factor': 1.0,
@@ -884,7 +816,8 @@ def _create_single_cluster_result(
 ) -> Dict[str, Any]:
     """Create a single cluster result when clustering isn't possible/needed."""
     
-    redshift_span = np.max(redshifts) - np.min(redshifts) if len(redshifts) > 1 else 0.0
+    z_lo, z_hi = np.min(redshifts), np.max(redshifts)
+    redshift_span = z_hi - z_lo if len(redshifts) > 1 else 0.0
     
     # Get metric values using best available metric
     from snid_sage.shared.utils.math_utils import get_best_metric_value
@@ -918,7 +851,7 @@ def _create_single_cluster_result(
         'cluster_method': 'single_cluster',
         'rlap_range': (np.min(rlaps), np.max(rlaps)),
         'metric_range': (np.min(metric_values), np.max(metric_values)),  # NEW
-        'redshift_range': (np.min(redshifts), np.max(redshifts)),
+        'redshift_range': (z_lo, z_hi),
         'top_5_values': [],
         'top_5_mean': 0.0,
         'penalty_factor': 1.0,
@@ -1007,19 +940,16 @@ def choose_subtype_weighted_voting(
         top_members = sorted_members[:5]
         top_values = [m['metric_value'] for m in top_members]
         # Compute weights using the same scheme as weighted redshift: w = (metric)^2 / sigma_z^2
-        from snid_sage.shared.utils.math_utils import compute_cluster_weights
+        from snid_sage.shared.utils.math_utils import WeightedInputs
         metrics_array = np.asarray([m['metric_value'] for m in top_members], dtype=float)
         sigmas_array = np.asarray([
             (m.get('redshift_error') if m.get('redshift_error') is not None else np.nan)
             for m in top_members
         ], dtype=float)
-        # Valid where finite and sigma > 0
-        valid_mask = (np.isfinite(metrics_array) & np.isfinite(sigmas_array) & (sigmas_array > 0))
-        if np.any(valid_mask):
-            weights = compute_cluster_weights(metrics_array[valid_mask], sigmas_array[valid_mask])
-            sum_w = np.sum(weights)
-            mean_top = float(np.sum(weights * metrics_array[valid_mask]) / sum_w) if sum_w > 0 else (sum(top_values) / len(top_values))
-        else:
+        # The metric is both the averaged value and the weight; rows need finite
+        # values and sigma > 0 (validated with the shared mask in from_raw)
+        mean_top = WeightedInputs.from_raw(metrics_array, sigmas_array, metrics_array).mean()
+        if math.isnan(mean_top):
             # Fallback to unweighted mean if no valid uncertainties
             mean_top = sum(top_values) / len(top_values)
         
@@ -1201,15 +1131,11 @@ def find_winning_cluster_top5_method(
         
         # Calculate weighted mean of top 5 using w = metric^2 / sigma_z^2; fallback to unweighted mean
         if top_5_values:
-            from snid_sage.shared.utils.math_utils import compute_cluster_weights
+            from snid_sage.shared.utils.math_utils import WeightedInputs
             metrics_array = np.asarray(top_5_values, dtype=float)
             sigmas_array = np.asarray(sigmas, dtype=float)
-            valid_mask = (np.isfinite(metrics_array) & np.isfinite(sigmas_array) & (sigmas_array > 0))
-            if np.any(valid_mask):
-                weights = compute_cluster_weights(metrics_array[valid_mask], sigmas_array[valid_mask])
-                sum_w = np.sum(weights)
-                top_5_mean = float(np.sum(weights * metrics_array[valid_mask]) / sum_w) if sum_w > 0 else float(np.mean(metrics_array))
-            else:
+            top_5_mean = WeightedInputs.from_raw(metrics_array, sigmas_array, metrics_array).mean()
+            if math.isnan(top_5_mean):
                 top_5_mean = float(np.mean(metrics_array))
         else:
             top_5_mean = 0.0
@@ -287,23 +287,26 @@ def weighted_median_from_rlap(
     if not rpeaks or not lpeaks or not zpeaks:
         return 0.0
     
-    buf = []
-    for r, l, z in zip(rpeaks, lpeaks, zpeaks):
-        rl = r * l
-        
-        # Add entries to buffer based on r*l thresholds
-        nadd = 0
-        if rl > 4.0:
-            nadd += 1
-        if rl > 5.0:
-            nadd += 2
-        if rl > 6.0:
-            nadd += 2
-        
-        buf.extend([z] * nadd)
+    n = min(len(rpeaks), len(lpeaks), len(zpeaks))
+    rl = np.asarray(rpeaks[:n], dtype=float) * np.asarray(lpeaks[:n], dtype=float)
+    
+    # Integer weight per peak based on r*l thresholds (1 + 2 + 2)
+    nadd = (rl > 4.0).astype(np.intp) + 2 * (rl > 5.0) + 2 * (rl > 6.0)
+    keep = nadd > 0
+    if not keep.any():
+        return 0.0
+    z = np.asarray(zpeaks[:n], dtype=float)[keep]
+    if np.isnan(z).any():
+        return float('nan')
     
     # DEPRECATED: Simple median calculation - use enhanced methods instead
-    return float(np.median(buf)) if buf else 0.0
+    # Median of z repeated nadd times, without building the repeated buffer:
+    # pick the two middle positions from the cumulative counts (equal when odd).
+    order = np.argsort(z, kind='stable')
+    counts = np.cumsum(nadd[keep][order])
+    total = int(counts[-1])
+    mid = np.searchsorted(counts, [(total - 1) // 2, total // 2], side='right')
+    return float(z[order[mid]].mean())
 
 
 
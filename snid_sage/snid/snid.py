@@ -199,12 +199,14 @@ def preprocess_spectrum(
     if input_spectrum is not None:
         wave, flux = input_spectrum
         _LOG.info("Step 0: Using provided spectrum input")
-        _LOG.info(f"  Wavelength range: {wave.min():.1f} - {wave.max():.1f} Å")
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info("  Wavelength range: %.1f - %.1f Å", wave.min(), wave.max())
         _LOG.info(f"  Number of points: {len(wave)}")
     elif spectrum_path is not None:
         wave, flux = read_spectrum(spectrum_path)
         _LOG.info(f"Step 0: Read spectrum from {spectrum_path}")
-        _LOG.info(f"  Wavelength range: {wave.min():.1f} - {wave.max():.1f} Å")
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info("  Wavelength range: %.1f - %.1f Å", wave.min(), wave.max())
         _LOG.info(f"  Number of points: {len(wave)}")
     else:
         raise ValueError("Either spectrum_path or input_spectrum must be provided")
@@ -1529,12 +1531,13 @@ def run_snid_analysis(
         _LOG.info("  → Skipping normal correlation search, using per-type template loading")
         
         # Additional debugging for forced redshift + advanced preprocessing
-        _LOG.debug(f"Forced redshift analysis parameters:")
-        _LOG.debug(f"  - tapered_flux shape: {tapered_flux.shape}")
-        _LOG.debug(f"  - tapered_flux range: {np.min(tapered_flux):.2e} to {np.max(tapered_flux):.2e}")
-        _LOG.debug(f"  - log_wave shape: {log_wave.shape}")
-        _LOG.debug(f"  - left_edge: {left_edge}, right_edge: {right_edge}")
-        _LOG.debug(f"  - NW_grid: {NW_grid}, DWLOG_grid: {DWLOG_grid}")
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Forced redshift analysis parameters:")
+            _LOG.debug(f"  - tapered_flux shape: {tapered_flux.shape}")
+            _LOG.debug(f"  - tapered_flux range: {np.min(tapered_flux):.2e} to {np.max(tapered_flux):.2e}")
+            _LOG.debug(f"  - log_wave shape: {log_wave.shape}")
+            _LOG.debug(f"  - left_edge: {left_edge}, right_edge: {right_edge}")
+            _LOG.debug(f"  - NW_grid: {NW_grid}, DWLOG_grid: {DWLOG_grid}")
         
         try:
             matches = _run_forced_redshift_analysis_optimized(
@@ -20,12 +20,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Any, Set, Optional
 from collections import Counter, defaultdict
 import logging
-from snid_sage.shared.utils.math_utils.weighted_statistics import (
-    estimate_weighted_redshift,
-    weighted_redshift_se,
-    estimate_weighted_epoch,
-    weighted_epoch_se,
-)
+from snid_sage.shared.utils.math_utils.weighted_statistics import weighted_summary_batch
 
 # ----------------------------------------------------------------------
 # 0.  Constants from Fortran SNID.INC
@@ -377,110 +372,68 @@ def compute_type_subtype_stats(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
     if not matches:
         return {}
     
-    # Group by type and subtype
+    # Group by type and subtype (as row indices into matches)
     type_groups = {}
-    for m in matches:
+    for i, m in enumerate(matches):
         tp = m['template'].get('type', 'Unknown')
         sub = m['template'].get('subtype', 'Unknown')
         
         if tp not in type_groups:
             type_groups[tp] = {'_all': [], 'subtypes': {}}
         
-        type_groups[tp]['_all'].append(m)
+        type_groups[tp]['_all'].append(i)
         
         if sub not in type_groups[tp]['subtypes']:
             type_groups[tp]['subtypes'][sub] = []
-        type_groups[tp]['subtypes'][sub].append(m)
+        type_groups[tp]['subtypes'][sub].append(i)
+    
+    # Per-match columns, gathered once and shared by the type and subtype groups
+    from snid_sage.shared.utils.math_utils import get_best_metric_value
+    n = len(matches)
+    z_col = np.empty(n)
+    z_err_col = np.empty(n)
+    metric_col = np.empty(n)
+    age_col = np.empty(n)
+    for i, m in enumerate(matches):
+        z = m['redshift']
+        z_err = m.get('redshift_error', 0.0)
+        age = m.get('age', m['template'].get('age', 0.0))
+        z_col[i] = z if z is not None else np.nan
+        z_err_col[i] = z_err if z_err is not None else np.nan
+        # Use RLAP-cos if available, otherwise RLAP
+        metric_col[i] = get_best_metric_value(m)
+        # Only templates with age_flag == 0 contribute to the age estimate
+        age_ok = age is not None and m['template'].get('age_flag', 0) == 0
+        age_col[i] = age if age_ok else np.nan
+    has_age = np.isfinite(age_col) & np.isfinite(z_err_col) & (z_err_col > 0)
+    
+    # One segment per (type, '_all') and (type, subtype) group, all reduced in
+    # a single batched call each for redshift and age
+    groups = []
+    for tp, data in type_groups.items():
+        groups.append((tp, '_all', data['_all']))
+        for sub, sub_rows in data['subtypes'].items():
+            groups.append((tp, sub, sub_rows))
+    rows = np.concatenate([np.asarray(g[2], dtype=np.intp) for g in groups])
+    offsets = np.zeros(len(groups) + 1, dtype=np.intp)
+    np.cumsum([len(g[2]) for g in groups], out=offsets[1:])
+    
+    # Weighted mean and SE using canonical weights
+    z_means, z_ses = weighted_summary_batch(z_col[rows], z_err_col[rows], metric_col[rows], offsets)
+    age_means, age_ses = weighted_summary_batch(age_col[rows], z_err_col[rows], metric_col[rows], offsets)
+    age_counts = np.add.reduceat(has_age[rows], offsets[:-1])
     
-    # Compute statistics for each group
     stats = {}
-    for tp, data in type_groups.items():
-        stats[tp] = {}
-        
-        # Type-level statistics
-        all_matches = data['_all']
-        z_vals = np.array([m['redshift'] for m in all_matches])
-        z_errs = np.array([m.get('redshift_error', 0.0) for m in all_matches])
-        # Use RLAP-cos if available, otherwise RLAP
-        from snid_sage.shared.utils.math_utils import get_best_metric_value
-        rlap_metrics = np.array([get_best_metric_value(m) for m in all_matches])
-        
-        # Weighted mean and SE using canonical weights
-        z_mean = estimate_weighted_redshift(z_vals, z_errs, rlap_metrics)
-        z_std = weighted_redshift_se(z_vals, z_errs, rlap_metrics)
-        
-        # Age statistics
-        age_vals = []
-        age_rlap_metrics = []
-        age_z_errs = []
-        for m in all_matches:
-            age = m.get('age', m['template'].get('age', 0.0))
-            age_flag = m['template'].get('age_flag', 0)
-            if age_flag == 0:
-                z_err = m.get('redshift_error', 0.0)
-                if np.isfinite(age) and np.isfinite(z_err) and z_err > 0:
-                    age_vals.append(age)
-                    # Use RLAP-cos if available, otherwise RLAP
-                    age_rlap_metrics.append(get_best_metric_value(m))
-                    age_z_errs.append(z_err)
-        
-        if age_vals:
-            age_vals = np.array(age_vals)
-            age_rlap_metrics = np.array(age_rlap_metrics)
-            age_z_errs = np.array(age_z_errs)
-            age_mean = estimate_weighted_epoch(age_vals, age_z_errs, age_rlap_metrics)
-            age_std = weighted_epoch_se(age_vals, age_z_errs, age_rlap_metrics)
+    for k, (tp, key, group_rows) in enumerate(groups):
+        if age_counts[k] > 0:
+            age_mean, age_std = float(age_means[k]), float(age_ses[k])
         else:
             age_mean = age_std = 0.0
-        
-        stats[tp]['_all'] = {
-            'z_mean': z_mean, 'z_std': z_std,
+        stats.setdefault(tp, {})[key] = {
+            'z_mean': float(z_means[k]), 'z_std': float(z_ses[k]),
             'age_mean': age_mean, 'age_std': age_std,
-            'count': len(all_matches)
+            'count': len(group_rows)
         }
-        
-        # Subtype-level statistics
-        for sub, sub_matches in data['subtypes'].items():
-            if len(sub_matches) == 0:
-                continue
-                
-            z_vals = np.array([m['redshift'] for m in sub_matches])
-            z_errs = np.array([m.get('redshift_error', 0.0) for m in sub_matches])
-            # Use RLAP-cos if available, otherwise RLAP
-            rlap_metrics = np.array([get_best_metric_value(m) for m in sub_matches])
-            
-            z_mean = estimate_weighted_redshift(z_vals, z_errs, rlap_metrics)
-            z_std = weighted_redshift_se(z_vals, z_errs, rlap_metrics)
-            
-            # Age statistics
-            age_vals = []
-            age_rlap_metrics = []
-            age_z_errs = []
-            for m in sub_matches:
-                age = m.get('age', m['template'].get('age', 0.0))
-                age_flag = m['template'].get('age_flag', 0)
-                if age_flag == 0:
-                    z_err = m.get('redshift_error', 0.0)
-                    if np.isfinite(age) and np.isfinite(z_err) and z_err > 0:
-                        age_vals.append(age)
-                        # Use RLAP-cos if available, otherwise RLAP
-                        age_rlap_metrics.append(get_best_metric_value(m))
-                        age_z_errs.append(z_err)
-            
-            if age_vals:
-                age_vals = np.array(age_vals)
-                age_rlap_metrics = np.array(age_rlap_metrics)
-                age_z_errs = np.array(age_z_errs)
-                age_mean = estimate_weighted_epoch(age_vals, age_z_errs, age_rlap_metrics)
-                age_std = weighted_epoch_se(age_vals, age_z_errs, age_rlap_metrics)
-            else:
-                age_mean = age_std = 0.0
-            
-            stats[tp][sub] = {
-                'z_mean': z_mean, 'z_std': z_std,
-                'age_mean': age_mean, 'age_std': age_std,
-                'count': len(sub_matches)
-            }
     
     return stats
 
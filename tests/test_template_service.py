@@ -0,0 +1,122 @@
+"""
+Tests for TemplateService index caching and index serialization.
+"""
+
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("h5py")
+ts = pytest.importorskip("snid_sage.interfaces.template_manager.services.template_service")
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    """A fresh service whose user library is an empty temporary folder."""
+    monkeypatch.setattr(ts, "get_user_templates_dir", lambda strict=False: Path(tmp_path))
+    return ts.TemplateService()
+
+
+def _add(svc, name, ttype="Ia", subtype="Ia-norm", redshift=0.01):
+    wave = np.linspace(3000.0, 9000.0, 400)
+    flux = 1.0 + 0.1 * np.sin(wave / 150.0)
+    return svc.add_template_from_arrays(
+        name=name, ttype=ttype, subtype=subtype, age=0.0, redshift=redshift, wave=wave, flux=flux
+    )
+
+
+def test_add_invalidates_caches(service):
+    assert service.user_template_names() == frozenset()
+    assert not service.has_user_templates()
+    types_before = service.get_types_and_subtypes()[0]
+    merged_before = service.get_merged_index()["template_count"]
+
+    assert _add(service, "sn_test", ttype="TestType")
+
+    assert service.user_template_names() == frozenset({"sn_test"})
+    assert service.has_user_templates()
+    assert "TestType" in service.get_types_and_subtypes()[0]
+    assert "TestType" not in types_before
+    merged = service.get_merged_index()
+    assert "sn_test" in merged["templates"]
+    assert merged["template_count"] == merged_before + 1
+
+
+def test_update_metadata_invalidates_caches(service):
+    assert _add(service, "sn_test")
+    assert service.get_user_index()["templates"]["sn_test"]["subtype"] == "Ia-norm"
+    assert service.get_merged_index()["templates"]["sn_test"]["subtype"] == "Ia-norm"
+
+    assert service.update_metadata("sn_test", {"subtype": "Ia-91T", "type": "Ib"})
+
+    assert service.get_user_index()["templates"]["sn_test"]["subtype"] == "Ia-91T"
+    merged = service.get_merged_index()
+    assert merged["templates"]["sn_test"]["type"] == "Ib"
+    assert "sn_test" in merged["by_type"]["Ib"]["template_names"]
+
+
+def test_delete_invalidates_caches(service, tmp_path):
+    assert _add(service, "sn_a")
+    assert _add(service, "sn_b", redshift=0.02)
+    assert service.user_template_names() == frozenset({"sn_a", "sn_b"})
+
+    assert service.delete("sn_a")
+    assert service.user_template_names() == frozenset({"sn_b"})
+    assert "sn_a" not in service.get_merged_index()["templates"]
+
+    # Deleting the last template removes the file and rebuilds the index
+    assert service.delete("sn_b")
+    assert service.user_template_names() == frozenset()
+    assert not service.has_user_templates()
+    assert not list(tmp_path.glob("templates_*.user.hdf5"))
+
+
+def test_external_index_write_is_picked_up(service, tmp_path):
+    assert _add(service, "sn_test")
+    assert service.user_template_names() == frozenset({"sn_test"})
+
+    # Another process (e.g. the CLI) rewrites the index; the size changes even
+    # if the mtime resolution is coarse
+    idx_path = tmp_path / "template_index.user.json"
+    index = json.loads(idx_path.read_text(encoding="utf-8"))
+    index["templates"]["sn_external"] = dict(index["templates"]["sn_test"])
+    idx_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+
+    assert service.user_template_names() == frozenset({"sn_test", "sn_external"})
+    assert "sn_external" in service.get_merged_index()["templates"]
+
+
+def test_stale_read_is_not_cached_after_invalidation(service):
+    gen = service._cache_gen
+    key = service._cache_key()
+    service._invalidate_caches()
+    service._cache_store("names", key, gen, frozenset({"stale"}))
+    assert "names" not in service._caches
+    assert service.user_template_names() == frozenset()
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_index_json_round_trips(monkeypatch, tmp_path, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(ts, "ORJSON_AVAILABLE", use_orjson)
+    index = {
+        "templates": {
+            "sné": {"type": "Ia", "redshift": 1e-05, "epochs": 2, "storage_file": "a/b.hdf5"},
+            "sn_nan": {"type": "II", "redshift": float("nan"), "epochs": 1, "storage_file": "c.hdf5"},
+        },
+        "template_count": 2,
+    }
+    path = tmp_path / "template_index.user.json"
+    ts.TemplateService._write_json_atomic(path, index)
+    loaded = ts.TemplateService._read_json(path)
+    assert loaded["templates"]["sné"] == index["templates"]["sné"]
+    # NaN must survive as a float, not come back as None
+    assert math.isnan(float(loaded["templates"]["sn_nan"]["redshift"]))
+
+    finite = {"templates": {"sné": {"redshift": 1e-05}}}
+    ts.TemplateService._write_json_atomic(path, finite)
+    assert ts.TemplateService._read_json(path) == finite
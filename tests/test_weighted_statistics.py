@@ -0,0 +1,208 @@
+"""
+Tests for the weighted redshift/epoch estimators in
+snid_sage.shared.utils.math_utils.weighted_statistics.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from snid_sage.shared.utils.math_utils import weighted_statistics as ws
+from snid_sage.shared.utils.math_utils import (
+    WeightedInputs,
+    calculate_combined_weights,
+    estimate_weighted_epoch,
+    estimate_weighted_redshift,
+    weighted_epoch_se,
+    weighted_redshift_se,
+    weighted_summary,
+    weighted_summary_batch,
+)
+
+
+def reference_mean_se(values, sigmas, metrics):
+    """Straightforward mean/SE with w = metric^2 / sigma^2 over valid rows."""
+    x = np.asarray(values, dtype=np.float64)
+    s = np.asarray(sigmas, dtype=np.float64)
+    r = np.asarray(metrics, dtype=np.float64)
+    valid = np.isfinite(x) & np.isfinite(s) & np.isfinite(r) & (s > 0)
+    if not valid.any():
+        return math.nan, math.nan
+    x, s, r = x[valid], s[valid], r[valid]
+    w = r ** 2 / s ** 2
+    sum_w = w.sum()
+    if sum_w <= 0:
+        return math.nan, math.nan
+    mean = float(np.sum(w * x) / sum_w)
+    var_pop = float(np.sum(w * (x - mean) ** 2) / sum_w)
+    n_eff = sum_w ** 2 / np.sum(w ** 2)
+    denom = n_eff - 1.0 if n_eff > 1 else n_eff
+    return mean, math.sqrt(var_pop / denom)
+
+
+@pytest.fixture(params=["numpy", "python-kernel", "numba"])
+def backend(request, monkeypatch):
+    """Run each test with the NumPy fallback, the uncompiled kernels and (if installed) numba."""
+    if request.param == "numpy":
+        monkeypatch.setattr(ws, "_moments_kernel", False)
+        monkeypatch.setattr(ws, "_weights_ufunc", False)
+    elif request.param == "python-kernel":
+        # Same code the numba branch compiles, run as plain Python
+        monkeypatch.setattr(ws, "_moments_kernel", ws._west_moments)
+        monkeypatch.setattr(ws, "_weights_ufunc", ws._sq_ratio)
+    else:
+        pytest.importorskip("numba")
+        monkeypatch.setattr(ws, "_moments_kernel", None)
+        monkeypatch.setattr(ws, "_weights_ufunc", None)
+        assert ws._get_moments_kernel() is not None
+        assert ws._get_weights_ufunc() is not None
+    return request.param
+
+
+@pytest.fixture
+def cluster():
+    rng = np.random.default_rng(12345)
+    n = 40
+    z = rng.normal(0.05, 0.01, n)
+    t = rng.normal(5.0, 8.0, n)
+    sigma = rng.uniform(0.001, 0.01, n)
+    metric = rng.uniform(2.0, 20.0, n)
+    return z, t, sigma, metric
+
+
+def test_mean_and_se_match_reference(backend, cluster):
+    z, _, sigma, metric = cluster
+    mean, se = WeightedInputs.from_raw(z, sigma, metric).mean_and_se()
+    ref_mean, ref_se = reference_mean_se(z, sigma, metric)
+    assert mean == pytest.approx(ref_mean, rel=1e-12)
+    assert se == pytest.approx(ref_se, rel=1e-10)
+    assert WeightedInputs.from_raw(z, sigma, metric).mean() == pytest.approx(ref_mean, rel=1e-12)
+
+
+def test_public_estimators_agree_with_weighted_inputs(backend, cluster):
+    z, t, sigma, metric = cluster
+    assert estimate_weighted_redshift(z, sigma, metric) == pytest.approx(reference_mean_se(z, sigma, metric)[0], rel=1e-12)
+    assert weighted_redshift_se(z, sigma, metric) == pytest.approx(reference_mean_se(z, sigma, metric)[1], rel=1e-10)
+    assert estimate_weighted_epoch(t, sigma, metric) == pytest.approx(reference_mean_se(t, sigma, metric)[0], rel=1e-12)
+    assert weighted_epoch_se(t, sigma, metric) == pytest.approx(reference_mean_se(t, sigma, metric)[1], rel=1e-10)
+
+
+def test_invalid_rows_are_dropped(backend, cluster):
+    z, _, sigma, metric = cluster
+    z = z.copy()
+    sigma = sigma.copy()
+    metric = metric.copy()
+    z[3] = np.nan
+    sigma[5] = 0.0
+    sigma[7] = -0.002
+    sigma[9] = np.inf
+    metric[11] = np.nan
+    inputs = WeightedInputs.from_raw(z, sigma, metric)
+    assert inputs.values.size == len(z) - 5
+    mean, se = inputs.mean_and_se()
+    ref_mean, ref_se = reference_mean_se(z, sigma, metric)
+    assert mean == pytest.approx(ref_mean, rel=1e-12)
+    assert se == pytest.approx(ref_se, rel=1e-10)
+
+
+def test_no_valid_rows_gives_nan(backend):
+    inputs = WeightedInputs.from_raw([0.1, np.nan], [0.0, 0.01], [5.0, 5.0])
+    assert inputs.values.size == 0
+    assert all(math.isnan(v) for v in inputs.mean_and_se())
+    assert math.isnan(inputs.mean())
+    assert math.isnan(estimate_weighted_redshift([], [], []))
+
+
+def test_mismatched_lengths():
+    with pytest.raises(ValueError):
+        WeightedInputs.from_raw([0.1, 0.2], [0.01], [5.0, 5.0])
+    assert math.isnan(estimate_weighted_redshift([0.1, 0.2], [0.01], [5.0, 5.0]))
+    assert all(math.isnan(v) for v in weighted_summary([0.1], [1.0, 2.0], [0.01], [5.0]))
+
+
+def test_float32_matches_float64(backend, cluster):
+    z, t, sigma, metric = cluster
+    m64, se64 = WeightedInputs.from_raw(t, sigma, metric).mean_and_se()
+    inputs32 = WeightedInputs.from_raw(t, sigma, metric, dtype=np.float32)
+    assert inputs32.values.dtype == np.float32
+    assert inputs32.weights.dtype == np.float32
+    assert float(inputs32.weights.max()) == pytest.approx(1.0)
+    m32, se32 = inputs32.mean_and_se()
+    assert m32 == pytest.approx(m64, rel=1e-5)
+    assert se32 == pytest.approx(se64, rel=1e-4)
+    # float32 input arrays are accepted without promotion
+    m_in32, se_in32 = WeightedInputs.from_raw(
+        t.astype(np.float32), sigma.astype(np.float32), metric.astype(np.float32)
+    ).mean_and_se()
+    assert m_in32 == pytest.approx(m64, rel=1e-5)
+    assert se_in32 == pytest.approx(se64, rel=1e-4)
+
+
+def test_weighted_summary_matches_individual_estimators(backend, cluster):
+    z, t, sigma, metric = cluster
+    t = t.copy()
+    t[2] = np.nan  # age invalid on a row where redshift is valid
+    summary = weighted_summary(z, t, sigma, metric)
+    assert summary.z_mean == pytest.approx(estimate_weighted_redshift(z, sigma, metric), rel=1e-12)
+    assert summary.z_se == pytest.approx(weighted_redshift_se(z, sigma, metric), rel=1e-12)
+    assert summary.t_mean == pytest.approx(estimate_weighted_epoch(t, sigma, metric), rel=1e-12)
+    assert summary.t_se == pytest.approx(weighted_epoch_se(t, sigma, metric), rel=1e-12)
+
+
+def test_batch_csr_matches_per_cluster(backend):
+    rng = np.random.default_rng(7)
+    sizes = [5, 0, 1, 12, 3, 0, 8]
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    n = offsets[-1]
+    x = rng.normal(0.1, 0.02, n)
+    sigma = rng.uniform(0.001, 0.01, n)
+    metric = rng.uniform(1.0, 15.0, n)
+    x[4] = np.nan
+    sigma[10] = 0.0
+    metric[20] = np.nan
+    # A cluster whose only row is invalid
+    sigma[offsets[2]] = -1.0
+
+    means, ses = weighted_summary_batch(x, sigma, metric, offsets)
+    assert means.shape == ses.shape == (len(sizes),)
+    for k in range(len(sizes)):
+        sl = slice(offsets[k], offsets[k + 1])
+        ref_mean, ref_se = WeightedInputs.from_raw(x[sl], sigma[sl], metric[sl]).mean_and_se()
+        if math.isnan(ref_mean):
+            assert math.isnan(means[k])
+            assert math.isnan(ses[k])
+        else:
+            assert means[k] == pytest.approx(ref_mean, rel=1e-12)
+            assert ses[k] == pytest.approx(ref_se, rel=1e-9)
+
+
+def test_batch_padded_rows_match_per_cluster(backend, cluster):
+    z, t, sigma, metric = cluster
+    x = np.vstack([z[:20], t[:20]])
+    s = np.vstack([sigma[:20], sigma[20:]])
+    r = np.vstack([metric[:20], metric[20:]])
+    x[1, 15:] = np.nan  # padding for a short second cluster
+    means, ses = weighted_summary_batch(x, s, r)
+    for k in range(2):
+        ref_mean, ref_se = reference_mean_se(x[k], s[k], r[k])
+        assert means[k] == pytest.approx(ref_mean, rel=1e-12)
+        assert ses[k] == pytest.approx(ref_se, rel=1e-9)
+
+
+def test_batch_rejects_bad_offsets():
+    with pytest.raises(ValueError):
+        weighted_summary_batch([1.0, 2.0], [0.1, 0.1], [1.0, 1.0], [0, 1])
+    with pytest.raises(ValueError):
+        weighted_summary_batch([1.0, 2.0], [0.1, 0.1], [1.0, 1.0], [0, 2, 1, 2])
+    with pytest.raises(ValueError):
+        weighted_summary_batch(np.ones(3), np.ones(3), np.ones(3))
+
+
+def test_combined_weights(backend):
+    w = calculate_combined_weights([2.0, 3.0, 4.0], [0.1, 0.2, 0.4])
+    assert w.dtype == np.float64
+    np.testing.assert_allclose(w, [400.0, 225.0, 100.0])
+    # Non-positive uncertainties are floored at 0.1 x the smallest positive one
+    w = calculate_combined_weights([2.0, 2.0], [0.1, 0.0])
+    np.testing.assert_allclose(w, [400.0, 4.0 / 0.01 ** 2])